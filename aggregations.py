@@ -0,0 +1,505 @@
+"""Data loading, filtering and cached aggregations.
+
+Shared by the Streamlit dashboard (app.py) and the local aggregation API
+(api.py), so both read from the same Streamlit caches when they run in the
+same process. The caches show no spinner: they are also filled from the
+dashboard's worker pool and the API's request threads, which have no script
+run context to show one in.
+"""
+import os
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+DATA_FILE = "Aadhaar_enrollment_FeatureEngineering.csv"
+
+DAY_TYPES = ['All', 'Weekday Only', 'Weekend Only']
+
+DAY_NAMES = {
+    0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
+    4: 'Friday', 5: 'Saturday', 6: 'Sunday'
+}
+
+
+
+# Columns the rendered sections need. Everything else in the CSV is read
+# lazily, one column at a time, by load_column()/with_columns().
+CORE_COLUMNS = [
+    'state', 'district', 'year', 'quarter', 'month', 'day_of_week',
+    'is_weekend', 'total_enrollment', 'age_0_5', 'age_5_17', 'age_18_greater'
+]
+
+# Dictionary-encoded as categoricals. Categories are the sorted values of
+# the loaded file, so codes are not comparable across data refreshes.
+CATEGORICAL_COLUMNS = ['state', 'district']
+
+# Summed columns stay int64 so totals accumulate exactly as before; every
+# other integer column is downcast to the smallest width that holds it
+MEASURE_COLUMNS = ['total_enrollment', 'age_0_5', 'age_5_17', 'age_18_greater', 'minor_count']
+
+
+
+#------------ Load data -----------
+@st.cache_resource(show_spinner=False)
+def dataset_schema():
+    """Empty frame with every column of the dataset and its sampled dtype"""
+    return pd.read_csv(DATA_FILE, nrows=1000).iloc[:0]
+
+
+def normalise_schema(frame):
+    """Categorical-encode label columns and downcast non-measure integers"""
+    conversions = {}
+    for column in frame.columns:
+        if column in CATEGORICAL_COLUMNS:
+            conversions[column] = pd.CategoricalDtype(sorted(frame[column].dropna().unique()))
+        elif column not in MEASURE_COLUMNS and pd.api.types.is_integer_dtype(frame[column]):
+            conversions[column] = pd.to_numeric(frame[column], downcast='integer').dtype
+    return frame.astype(conversions)
+
+
+def _memory_by_column(frame):
+    return frame.memory_usage(index=False, deep=True)
+
+
+def _file_version():
+    stat = os.stat(DATA_FILE)
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+@st.cache_resource(show_spinner=False)
+def _load_core():
+    """Core columns after schema normalisation, the memory report and the
+    version of the file they were read from"""
+    # Taken before reading, so a file replaced mid-read gets a new version
+    version = _file_version()
+    columns = [c for c in CORE_COLUMNS if c in dataset_schema().columns]
+    raw = pd.read_csv(DATA_FILE, usecols=columns)[columns]
+    data = normalise_schema(raw)
+
+    report = pd.DataFrame({
+        'Column': columns,
+        'Dtype_Before': raw.dtypes.astype(str).values,
+        'Bytes_Before': _memory_by_column(raw).values,
+        'Dtype_After': data.dtypes.astype(str).values,
+        'Bytes_After': _memory_by_column(data).values,
+    })
+    report['Saved_%'] = (1 - report['Bytes_After'] / report['Bytes_Before']) * 100
+    return data, report, version
+
+
+def load_data():
+    """Load the core columns of the featured dataset (raises FileNotFoundError if missing)"""
+    return _load_core()[0]
+
+
+def memory_report():
+    """Bytes per core column before and after schema normalisation"""
+    return _load_core()[1]
+
+
+@st.cache_resource(show_spinner=False)
+def load_column(column):
+    """Read a single non-core column, aligned with load_data()'s index"""
+    return normalise_schema(pd.read_csv(DATA_FILE, usecols=[column]))[column]
+
+
+def with_columns(frame, columns):
+    """Rows of `frame` with any missing dataset columns loaded and joined"""
+    missing = [c for c in columns if c not in frame.columns]
+    if not missing:
+        return frame
+    return frame.assign(**{c: load_column(c).loc[frame.index] for c in missing})
+
+
+def data_version():
+    """Fingerprint of the dataset file as it was when load_data() read it,
+    used for HTTP validators"""
+    return _load_core()[2]
+
+
+
+# ------------ Filters ---------------
+class Filters(NamedTuple):
+    """Normalised sidebar selection. Empty tuples mean 'All'."""
+    states: tuple = ()
+    years: tuple = ()
+    quarters: tuple = ()
+    day_type: str = 'All'
+
+    @classmethod
+    def from_selection(cls, states=(), years=(), quarters=(), day_type='All'):
+        """Build filters from raw sidebar values ('All' or empty = no filter)"""
+        def normalise(selection):
+            if len(selection) == 0 or 'All' in selection:
+                return ()
+            return tuple(sorted(selection))
+
+        if day_type not in DAY_TYPES:
+            raise ValueError(f"Unknown day type: {day_type}")
+
+        return cls(normalise(states), normalise(years), normalise(quarters), day_type)
+
+    def narrow(self, states=(), quarters=()):
+        """Further restrict by cross-filter selections that the sidebar allows"""
+        def intersect(current, selected):
+            kept = tuple(sorted(v for v in selected if not current or v in current))
+            return kept or current
+
+        return self._replace(states=intersect(self.states, states),
+                             quarters=intersect(self.quarters, quarters))
+
+    def conditions(self):
+        """(column, allowed values) pairs for every active filter"""
+        conditions = [('state', self.states), ('year', self.years), ('quarter', self.quarters)]
+        if self.day_type == 'Weekday Only':
+            conditions.append(('is_weekend', (0,)))
+        elif self.day_type == 'Weekend Only':
+            conditions.append(('is_weekend', (1,)))
+        return [(column, values) for column, values in conditions if values]
+
+
+FILTER_COLUMNS = ['state', 'year', 'quarter', 'is_weekend']
+
+
+@st.cache_resource(show_spinner=False)
+def _row_index():
+    """Sorted row positions for every value of every filter column"""
+    data = load_data()
+    return {column: data.groupby(column, observed=True).indices for column in FILTER_COLUMNS}
+
+
+def _rows_matching(column, values):
+    index = _row_index()[column]
+    parts = [index[v] for v in values if v in index]
+    if not parts:
+        return np.empty(0, dtype=np.intp)
+    return np.sort(np.concatenate(parts))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def filter_data(filters):
+    """Rows of the dataset matching the filters (shared, do not mutate)"""
+    data = load_data()
+    conditions = filters.conditions()
+    if not conditions:
+        return data
+
+    # Start from the index rows of the most selective filter and only check
+    # the remaining filters on those rows, instead of scanning every row
+    index = _row_index()
+    conditions.sort(key=lambda c: sum(len(index[c[0]].get(v, ())) for v in c[1]))
+
+    positions = _rows_matching(*conditions[0])
+    for column, values in conditions[1:]:
+        positions = positions[data[column].take(positions).isin(values).to_numpy()]
+
+    return data.take(positions)
+
+
+
+# ------------ Aggregate cubes ---------------
+# Sums and record counts of the measures, grouped by every filter column
+# plus the dimensions a summary breaks down by. Filtering a cube and
+# summing it again gives the same totals as grouping the filtered rows,
+# on a few thousand cube rows instead of the full dataset, so a change of
+# filters (e.g. a cross-filter click) never goes back to the raw rows.
+
+@st.cache_resource(show_spinner=False)
+def _cube(dimensions=()):
+    """Measure sums and 'records' per filter column and dimension combination"""
+    data = load_data()
+    keys = FILTER_COLUMNS + list(dimensions)
+    measures = [c for c in MEASURE_COLUMNS if c in data.columns]
+    grouped = data.groupby(keys, observed=True)
+    cube = grouped[measures].sum()
+    cube['records'] = grouped.size()
+    return cube.reset_index()
+
+
+def _cube_slice(filters, dimensions=()):
+    """Cube rows matching the filters (shared, do not mutate)"""
+    cube = _cube(tuple(d for d in dimensions if d not in FILTER_COLUMNS))
+    mask = np.ones(len(cube), dtype=bool)
+    for column, values in filters.conditions():
+        mask &= cube[column].isin(values).to_numpy()
+    return cube[mask]
+
+
+def _rollup(filters, dimensions):
+    """Measure sums and 'records' per value of `dimensions`, as grouping the
+    filtered rows by them would give"""
+    cube = _cube_slice(filters, dimensions)
+    measures = [c for c in cube.columns if c in MEASURE_COLUMNS or c == 'records']
+    return cube.groupby(list(dimensions), observed=True)[measures].sum()
+
+
+def _enrollment_stats(filters, dimensions):
+    """Sum, mean and count of total_enrollment per value of `dimensions`"""
+    rollup = _rollup(filters, dimensions)
+    return pd.DataFrame({
+        'sum': rollup['total_enrollment'],
+        'mean': rollup['total_enrollment'] / rollup['records'],
+        'count': rollup['records'],
+    })
+
+
+
+# ------------ Aggregations ---------------
+# Results go through _plain() so categorical and downcast key columns come
+# back as the same object/int64 values the raw CSV would have produced.
+
+def _plain(frame):
+    """Undo the compact dtypes on an aggregation result"""
+    conversions = {}
+    for column, dtype in frame.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            conversions[column] = object
+        elif pd.api.types.is_integer_dtype(dtype) and dtype != 'int64':
+            conversions[column] = 'int64'
+    return frame.astype(conversions) if conversions else frame
+
+
+@st.cache_data(show_spinner=False)
+def kpi_summary(filters):
+    """One-row frame with the headline KPIs"""
+    cube = _cube_slice(filters, ['district'])
+    total, records = cube['total_enrollment'].sum(), cube['records'].sum()
+    return pd.DataFrame([{
+        'Total_Enrollment': total,
+        'Avg_Enrollment': total / records if records else np.nan,
+        'Total_States': cube['state'].nunique(),
+        'Total_Districts': cube['district'].nunique(),
+        'Total_Records': records,
+    }])
+
+
+@st.cache_data(show_spinner=False)
+def monthly_summary(filters):
+    """Total, average and record count per month"""
+    monthly_data = _enrollment_stats(filters, ['month']).reset_index()
+    monthly_data.columns = ['Month', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
+    return _plain(monthly_data)
+
+
+@st.cache_data(show_spinner=False)
+def quarterly_summary(filters):
+    """Total and average enrollment per quarter"""
+    quarterly_data = _enrollment_stats(filters, ['quarter'])[['sum', 'mean']].reset_index()
+    quarterly_data.columns = ['Quarter', 'Total_Enrollment', 'Avg_Enrollment']
+    return _plain(quarterly_data)
+
+
+@st.cache_data(show_spinner=False)
+def day_of_week_summary(filters):
+    """Total and average enrollment per day of week, with day names"""
+    dow_data = _enrollment_stats(filters, ['day_of_week'])[['sum', 'mean']].reset_index()
+    dow_data.columns = ['Day_of_Week', 'Total_Enrollment', 'Avg_Enrollment']
+    dow_data['Day_Name'] = dow_data['Day_of_Week'].map(DAY_NAMES)
+    return _plain(dow_data)
+
+
+@st.cache_data(show_spinner=False)
+def weekend_summary(filters):
+    """Total and average enrollment for weekdays vs weekends"""
+    weekend_comparison = _enrollment_stats(filters, ['is_weekend'])[['sum', 'mean']].reset_index()
+    weekend_comparison['Type'] = weekend_comparison['is_weekend'].map({0: 'Weekday', 1: 'Weekend'})
+    return _plain(weekend_comparison)
+
+
+@st.cache_data(show_spinner=False)
+def state_summary(filters):
+    """Total, average and record count per state, in state order"""
+    state_data = _enrollment_stats(filters, ['state']).reset_index()
+    state_data.columns = ['State', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
+    return _plain(state_data)
+
+
+@st.cache_data(show_spinner=False)
+def district_summary(filters, state=None):
+    """Per-district totals, largest first; restricted to one state if given"""
+    district_data = _enrollment_stats(filters, ['state', 'district'])
+
+    if state is None:
+        district_data = district_data.reset_index()
+        district_data.columns = ['State', 'District', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
+    else:
+        in_state = district_data.index.get_level_values('state') == state
+        district_data = district_data[in_state].droplevel('state').reset_index()
+        district_data.columns = ['District', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
+
+    return _plain(district_data.sort_values('Total_Enrollment', ascending=False))
+
+
+@st.cache_data(show_spinner=False)
+def age_distribution(filters):
+    """Enrollment count per age group, or None if age columns are missing"""
+    cube = _cube_slice(filters)
+    if 'age_0_5' not in cube.columns:
+        return None
+
+    return pd.DataFrame({
+        'Age_Group': ['0-5 years', '5-17 years', '18+ years'],
+        'Count': [
+            cube['age_0_5'].sum(),
+            cube['age_5_17'].sum(),
+            cube['age_18_greater'].sum(),
+        ]
+    })
+
+
+@st.cache_data(show_spinner=False)
+def yearly_summary(filters):
+    """Total and average per year, with growth % when there are several years"""
+    yearly_data = _enrollment_stats(filters, ['year'])[['sum', 'mean']].reset_index()
+    yearly_data.columns = ['Year', 'Total_Enrollment', 'Avg_Enrollment']
+
+    if len(yearly_data) > 1:
+        yearly_data['Growth_%'] = yearly_data['Total_Enrollment'].pct_change() * 100
+
+    return _plain(yearly_data)
+
+
+@st.cache_data(show_spinner=False)
+def state_comparison(filters, states):
+    """Monthly totals and summary statistics for the compared states"""
+    compare_data = filter_data(filters)
+    compare_data = compare_data[compare_data['state'].isin(states)]
+
+    # Monthly comparison
+    monthly_compare = compare_data.groupby(['state', 'month'], observed=True)['total_enrollment'].sum().reset_index()
+
+    # State statistics
+    state_stats = compare_data.groupby('state', observed=True)['total_enrollment'].agg(['sum', 'mean', 'median', 'std']).reset_index()
+    state_stats.columns = ['State', 'Total', 'Mean', 'Median', 'Std Dev']
+
+    return _plain(monthly_compare), _plain(state_stats)
+
+
+
+# ------------ Period-over-period growth ---------------
+# Periods become consecutive ordinals (e.g. year * 12 + month - 1), so the
+# "previous period" of every region is a single column shift on a
+# region x period matrix instead of a per-region loop.
+GROWTH_PERIODS = {
+    'MoM': ('month', 12),
+    'QoQ': ('quarter', 4),
+    'YoY': (None, 1),
+}
+
+GROWTH_LEVELS = {
+    'State': ['state'],
+    'District': ['state', 'district'],
+}
+
+
+def _period_ordinal(frame, granularity):
+    column, per_year = GROWTH_PERIODS[granularity]
+    ordinal = frame['year'].astype('int64') * per_year
+    if column is not None:
+        ordinal = ordinal + frame[column].astype('int64') - 1
+    return ordinal.rename('period')
+
+
+def _period_label(ordinal, granularity):
+    year, offset = divmod(ordinal, GROWTH_PERIODS[granularity][1])
+    if granularity == 'MoM':
+        return f"{year}-{offset + 1:02d}"
+    if granularity == 'QoQ':
+        return f"{year}-Q{offset + 1}"
+    return str(year)
+
+
+@st.cache_resource(show_spinner=False)
+def _data_end():
+    """Last day the dataset covers"""
+    if 'date' in dataset_schema().columns:
+        dates = pd.to_datetime(load_column('date'), errors='coerce')
+        if dates.notna().any():
+            return dates.max().normalize()
+
+    # Without dates, the latest month is taken to be complete
+    data = load_data()
+    year = int(data['year'].max())
+    month = int(data.loc[data['year'] == year, 'month'].max())
+    return pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)
+
+
+def _last_complete_period(granularity):
+    """Ordinal of the last period the dataset covers in full"""
+    per_year = GROWTH_PERIODS[granularity][1]
+    following = _data_end() + pd.Timedelta(days=1)
+    return following.year * per_year + (following.month - 1) * per_year // 12 - 1
+
+
+@st.cache_data(show_spinner=False)
+def growth_matrices(filters, level, granularity):
+    """Region x period totals and growth % against the previous period"""
+    keys = GROWTH_LEVELS[level]
+    period_column = GROWTH_PERIODS[granularity][0]
+    cube = _cube_slice(filters, keys + [period_column] if period_column else keys)
+
+    if len(cube) == 0:
+        empty = pd.DataFrame(index=pd.Index([], name='Region'))
+        return empty, empty
+
+    ordinal = _period_ordinal(cube, granularity)
+
+    # Regions without records in a period that exists in the data count as 0;
+    # periods missing from the data altogether stay NaN and break the chain
+    totals = (
+        cube.groupby([cube[k] for k in keys] + [ordinal], observed=True)['total_enrollment']
+        .sum()
+        .unstack('period', fill_value=0)
+    )
+    periods = range(int(ordinal.min()), int(ordinal.max()) + 1)
+    totals = totals.reindex(columns=periods)
+
+    previous = totals.shift(1, axis=1)
+    growth = ((totals / previous - 1) * 100).replace([np.inf, -np.inf], np.nan)
+
+    if level == 'District':
+        regions = (totals.index.get_level_values('state').astype(str) + ' - '
+                   + totals.index.get_level_values('district').astype(str))
+    else:
+        regions = totals.index.astype(str)
+
+    labels = [_period_label(p, granularity) for p in periods]
+    for matrix in (totals, growth):
+        matrix.index = pd.Index(regions, name='Region')
+        matrix.columns = labels
+
+    return totals, growth
+
+
+@st.cache_data(show_spinner=False)
+def growth_ranking(filters, level, granularity):
+    """Regions ranked by growth in the latest complete period that has a
+    growth figure, fastest first"""
+    totals, growth = growth_matrices(filters, level, granularity)
+    columns = ['Rank', 'Region', 'Period', 'Total', 'Previous_Total', 'Growth_%', 'Avg_Growth_%']
+
+    # A period the data only partly covers would show a spurious drop.
+    # Labels of one granularity sort chronologically as strings.
+    last_complete = _period_label(_last_complete_period(granularity), granularity)
+    complete = [period for period in totals.columns if period <= last_complete]
+
+    # Periods filtered out (e.g. only Q1 selected for QoQ) have no growth,
+    # and neither has the period after them
+    with_growth = [i for i, period in enumerate(complete) if growth[period].notna().any()]
+    if not with_growth:
+        return pd.DataFrame(columns=columns)
+
+    latest, previous = complete[with_growth[-1]], complete[with_growth[-1] - 1]
+    ranking = pd.DataFrame({
+        'Region': totals.index,
+        'Period': latest,
+        'Total': totals[latest].values,
+        'Previous_Total': totals[previous].values,
+        'Growth_%': growth[latest].values,
+        'Avg_Growth_%': growth[complete].mean(axis=1).values,
+    })
+    ranking = ranking.sort_values('Growth_%', ascending=False, na_position='last', kind='stable')
+    ranking['Rank'] = ranking['Growth_%'].rank(ascending=False, method='min').astype('Int64')
+    return ranking[columns].reset_index(drop=True)
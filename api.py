@@ -0,0 +1,196 @@
+"""Local read-only aggregation API.
+
+Serves the dashboard's filtered aggregations as JSON or Arrow IPC so other
+tools can read the numbers without triggering Streamlit reruns. Filters use
+the same parameters as the sidebar:
+
+    GET /monthly?states=Kerala&states=Goa&years=2025&quarters=1&day_type=Weekend+Only
+    GET /districts?state=Kerala&format=arrow
+
+Every response carries an ETag derived from the dataset version and the
+request, so polling with If-None-Match gets a 304 without any aggregation.
+
+Run standalone with `python api.py --port 8502`, or set AADHAAR_API_PORT
+before `streamlit run app.py` to serve from inside the dashboard process,
+sharing its aggregation cache.
+"""
+import argparse
+import hashlib
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pyarrow as pa
+
+from aggregations import (
+    Filters, data_version, kpi_summary, monthly_summary, quarterly_summary,
+    day_of_week_summary, state_summary, district_summary, age_distribution,
+    yearly_summary
+)
+
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+
+ENDPOINTS = {
+    "/kpis": kpi_summary,
+    "/monthly": monthly_summary,
+    "/quarterly": quarterly_summary,
+    "/day-of-week": day_of_week_summary,
+    "/states": state_summary,
+    "/districts": district_summary,
+    "/age-distribution": age_distribution,
+    "/yearly": yearly_summary,
+}
+
+
+
+#------------ Request parsing -----------
+def _list_param(query, name, cast=str):
+    """Repeated or comma separated query values, e.g. ?years=2024,2025"""
+    values = []
+    for raw in query.get(name, []):
+        values.extend(v.strip() for v in raw.split(',') if v.strip())
+    return [v if v == 'All' else cast(v) for v in values]
+
+
+def parse_filters(query):
+    """Sidebar filters from a parsed query string"""
+    return Filters.from_selection(
+        _list_param(query, 'states'),
+        _list_param(query, 'years', int),
+        _list_param(query, 'quarters', int),
+        query.get('day_type', ['All'])[0],
+    )
+
+
+def wants_arrow(query, accept):
+    """Arrow is chosen by ?format=arrow or an Arrow Accept header"""
+    if 'format' in query:
+        return query['format'][0] == 'arrow'
+    return ARROW_MIME in (accept or '')
+
+
+def make_etag(path, filters, state, arrow):
+    """Strong validator for a response, computed without aggregating"""
+    key = repr((data_version(), path, tuple(filters), state, arrow))
+    return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest() + '"'
+
+
+
+#------------ Serialisation -----------
+def to_json(path, frame):
+    """JSON body; KPIs are a single object, everything else a list of rows"""
+    records = json.loads(frame.to_json(orient='records'))
+    if path == "/kpis":
+        records = records[0]
+    return json.dumps(records).encode('utf-8')
+
+
+def to_arrow(frame):
+    """Arrow IPC stream body"""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+
+#------------ HTTP handler -----------
+class AggregationHandler(BaseHTTPRequestHandler):
+    """Read-only handler for the aggregation endpoints"""
+
+    server_version = "AadhaarAggregationAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/":
+            self._send(200, "application/json", json.dumps(sorted(ENDPOINTS)).encode('utf-8'))
+            return
+
+        aggregate = ENDPOINTS.get(url.path)
+        if aggregate is None:
+            self._send_error(404, f"Unknown endpoint: {url.path}")
+            return
+
+        try:
+            filters = parse_filters(query)
+        except ValueError as exc:
+            self._send_error(400, str(exc))
+            return
+
+        state = query.get('state', [None])[0] if url.path == "/districts" else None
+        arrow = wants_arrow(query, self.headers.get('Accept'))
+
+        try:
+            etag = make_etag(url.path, filters, state, arrow)
+        except FileNotFoundError:
+            self._send_error(503, "Data file not found!")
+            return
+
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            self._send(304, None, b'', etag)
+            return
+
+        frame = aggregate(filters, state) if url.path == "/districts" else aggregate(filters)
+        if frame is None:
+            self._send_error(404, "Age group data not available in dataset")
+            return
+
+        if arrow:
+            self._send(200, ARROW_MIME, to_arrow(frame), etag)
+        else:
+            self._send(200, "application/json", to_json(url.path, frame), etag)
+
+    def _send(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        self._send(status, "application/json", json.dumps({"error": message}).encode('utf-8'))
+
+
+
+#------------ Server -----------
+def make_server(host="127.0.0.1", port=8502):
+    """Create (but do not start) the API server"""
+    return ThreadingHTTPServer((host, port), AggregationHandler)
+
+
+def start_in_background(host="127.0.0.1", port=8502):
+    """Serve from a daemon thread and return the server"""
+    server = make_server(host, port)
+    thread = threading.Thread(target=server.serve_forever, name="aggregation-api", daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local read-only aggregation API for the dashboard")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Serving aggregations on http://{args.host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,18 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import warnings
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+import figures
+import rendering
+from aggregations import (
+    DAY_TYPES, Filters, dataset_schema, load_data, with_columns, filter_data, kpi_summary, monthly_summary,
+    quarterly_summary, day_of_week_summary, weekend_summary, state_summary,
+    district_summary, age_distribution, yearly_summary, state_comparison,
+    memory_report, GROWTH_LEVELS, GROWTH_PERIODS, growth_matrices, growth_ranking
+)
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -50,17 +58,24 @@ st.markdown("""
 
 
 #------------ Load data -----------
-@st.cache_data
-def load_data():
-    """Load the featured dataset"""
-    try:
-        data = pd.read_csv("Aadhaar_enrollment_FeatureEngineering.csv")
-        return data
-    except FileNotFoundError:
-        st.error("Data file not found!")
-        st.stop()
+try:
+    with st.spinner("Loading data..."):
+        data = load_data()
+except FileNotFoundError:
+    st.error("Data file not found!")
+    st.stop()
+
+
 
-data = load_data()
+#------------ Local aggregation API -----------
+@st.cache_resource
+def start_api(port):
+    """Serve api.py from this process so it shares the aggregation cache"""
+    import api
+    return api.start_in_background(os.environ.get("AADHAAR_API_HOST", "127.0.0.1"), port)
+
+if os.environ.get("AADHAAR_API_PORT"):
+    start_api(int(os.environ["AADHAAR_API_PORT"]))
 
 
 
@@ -73,7 +88,8 @@ states = ['All'] + sorted(data['state'].unique().tolist())
 selected_states = st.sidebar.multiselect(
     "Select States",
     options = states,
-    default = ['All']
+    default = ['All'],
+    key = "selected_states"
 )
 
 # Year filter 
@@ -81,7 +97,8 @@ years = ['All'] + sorted(data['year'].unique().tolist())
 selected_years = st.sidebar.multiselect(
     "Select Years",
     options = years,
-    default = ['All']
+    default = ['All'],
+    key = "selected_years"
 )
 
 # Quarter filter 
@@ -89,39 +106,133 @@ quarters = ['All'] + sorted(data['quarter'].unique().tolist())
 selected_quarters = st.sidebar.multiselect(
     "Select Quarter",
     options = quarters,
-    default = ['All']
+    default = ['All'],
+    key = "selected_quarters"
 )
 
 # Weekend filter 
 weekend_options = st.sidebar.radio(
     "Day Type",
-    options = ['All', 'Weekday Only', 'Weekend Only']
+    options = DAY_TYPES,
+    key = "weekend_options"
 )
 st.sidebar.markdown("---")
 st.sidebar.info("Use filters to explore specific segments of data")
 
 
 
-# ------------ Apply Filter ---------------
-filtered_data = data.copy()
+# ------------ Cross-filter ---------------
+# Clicking a state on the map / Top 15 states chart or a quarter on the
+# quarterly charts narrows every other section. Selections arrive through
+# the charts' on_select callbacks, which run before the script reruns.
+CROSS_FILTER_SOURCES = {
+    'map_chart': ('state', 'location'),
+    'top_states_chart': ('state', 'y'),
+    'quarter_bar_chart': ('quarter', 'x'),
+    'quarter_pie_chart': ('quarter', 'label'),
+}
+
+def on_chart_select(chart_key):
+    """Store the values picked on a chart as a cross-filter"""
+    dimension, field = CROSS_FILTER_SOURCES[chart_key]
+    points = st.session_state[chart_key]["selection"]["points"]
+    values = [point[field] for point in points if field in point]
+    if dimension == 'quarter':
+        values = [int(v) for v in values]
+
+    cross_filter = dict(st.session_state.get('cross_filter', {}))
+    if values:
+        cross_filter[dimension] = tuple(sorted(set(values)))
+    else:
+        cross_filter.pop(dimension, None)
+    st.session_state['cross_filter'] = cross_filter
 
-# State filter 
-if 'All' not in selected_states and len(selected_states) > 0:
-    filtered_data = filtered_data[filtered_data['state'].isin(selected_states)]
+def clear_cross_filter():
+    st.session_state['cross_filter'] = {}
 
-# Year filter 
-if 'All' not in selected_years and len(selected_years) > 0:
-    filtered_data = filtered_data[filtered_data['year'].isin(selected_years)]
 
-# Quarter filter
-if 'All' not in selected_quarters and len(selected_quarters) > 0:
-    filtered_data = filtered_data[filtered_data['quarter'].isin(selected_quarters)]
 
-# Weekend filter 
-if weekend_options == 'Weekday Only':
-    filtered_data = filtered_data[filtered_data['is_weekend'] == 0]
-elif weekend_options == 'Weekend Only':
-    filtered_data = filtered_data[filtered_data['is_weekend'] == 1]
+# ------------ Apply Filter ---------------
+sidebar_filters = Filters.from_selection(selected_states, selected_years, selected_quarters, weekend_options)
+
+# Cross-filter values the sidebar now excludes are dropped for good, so
+# they do not silently come back when the sidebar is widened again
+sidebar_values = {'state': sidebar_filters.states, 'quarter': sidebar_filters.quarters}
+cross_filter = {}
+for dimension, values in st.session_state.get('cross_filter', {}).items():
+    allowed = sidebar_values[dimension]
+    kept = tuple(v for v in values if not allowed or v in allowed)
+    if kept:
+        cross_filter[dimension] = kept
+st.session_state['cross_filter'] = cross_filter
+
+cross_states = cross_filter.get('state', ())
+cross_quarters = cross_filter.get('quarter', ())
+filters = sidebar_filters.narrow(cross_states, cross_quarters)
+
+# Charts that act as a cross-filter source ignore their own dimension,
+# so the clicked state or quarter stays visible next to the others
+state_source_filters = sidebar_filters.narrow(quarters=cross_quarters)
+quarter_source_filters = sidebar_filters.narrow(states=cross_states)
+
+# Filtered totals and states come from the aggregate cubes; only the
+# explorer and statistics sections look at the filtered rows themselves
+kpis = kpi_summary(filters).iloc[0]
+filtered_records = int(kpis['Total_Records'])
+available_states = state_summary(filters)['State'].tolist()
+
+
+# Keyed widgets keep their value across reruns even when their options
+# change. Forget it in that case so they fall back to their default, as
+# the unkeyed widgets did.
+def reset_on_new_options(key, options):
+    options = list(options)
+    options_key = key + "_options"
+    if st.session_state.get(options_key) != options:
+        st.session_state.pop(key, None)
+        st.session_state[options_key] = options
+
+
+
+# ------------ Background work ---------------
+# Heavy aggregations and figures are computed in a worker pool while the
+# page skeleton, KPIs and widgets render straight away. Every such section
+# gets a placeholder that is filled in as soon as its result is ready.
+# Pool threads have no script run context, so they only call cached
+# functions declared with show_spinner=False and never Streamlit commands.
+@st.cache_resource
+def get_executor():
+    """Worker pool shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 2), thread_name_prefix="dashboard-worker")
+
+# Work still queued by an earlier rerun of this session is obsolete now
+for future in st.session_state.get('pending_sections', []):
+    future.cancel()
+
+deferred_sections = {}
+
+# Serialized size of every chart and table sent in this rerun
+payload_report = rendering.PayloadReport()
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def cached_section(name, args, _compute):
+    """A section's result, figures fitted to the payload budget, and their
+    payload entries. Shared by every rerun and session with the same inputs,
+    so going back to an earlier selection rebuilds no figures."""
+    report = rendering.PayloadReport()
+    return rendering.fit_figures(_compute(*args), report), report.entries
+
+def compute_within_budget(compute, *args):
+    """Worker-side: compute a section (or reuse it), then record its payload"""
+    result, entries = cached_section(compute.__name__, args, compute)
+    payload_report.entries.extend(entries)
+    return result
+
+def defer(placeholder, render, compute, *args):
+    """Run compute(*args) in the worker pool and render(result) into placeholder"""
+    placeholder.caption("⏳ Loading...")
+    future = get_executor().submit(compute_within_budget, compute, *args)
+    deferred_sections[future] = (placeholder, render)
 
 
 
@@ -142,10 +253,20 @@ st.markdown("---")
 
 
 # Display filter status 
-if len(filtered_data) < len(data):
-    st.info(f"🔍 Showing **{len(filtered_data):,}** records out of **{len(data):,}** total records (filtered)")
+if filtered_records < len(data):
+    st.info(f"🔍 Showing **{filtered_records:,}** records out of **{len(data):,}** total records (filtered)")
 else:
     st.success(f"📈 Showing all **{len(data):,}** records")
+
+if cross_filter:
+    col_cross, col_clear = st.columns([5, 1])
+    with col_cross:
+        cross_labels = [f"State: {', '.join(filters.states)}"] if cross_states else []
+        if cross_quarters:
+            cross_labels.append(f"Quarter: {', '.join(f'Q{q}' for q in filters.quarters)}")
+        st.info(f"🎯 Cross-filter from chart selection — {' | '.join(cross_labels)}")
+    with col_clear:
+        st.button("Clear selection", on_click=clear_cross_filter, key="clear_cross_filter")
 st.markdown("---")
 
 
@@ -156,7 +277,7 @@ st.header("Key Performance Indicators")
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
-    total_enrollment = filtered_data['total_enrollment'].sum()
+    total_enrollment = int(kpis['Total_Enrollment'])
     st.metric(
         label = "Total Enrollments",
         value = f"{total_enrollment:,}",
@@ -164,7 +285,7 @@ with col1:
     )
 
 with col2:
-    avg_enrollment = filtered_data['total_enrollment'].mean()
+    avg_enrollment = kpis['Avg_Enrollment']
     st.metric(
         label = "Average Enrollment",
         value = f"{avg_enrollment:,.0f}",
@@ -172,7 +293,7 @@ with col2:
     )
 
 with col3:
-    total_states = filtered_data['state'].nunique()
+    total_states = int(kpis['Total_States'])
     st.metric(
         label = "Total States",
         value = f"{total_states}",
@@ -180,7 +301,7 @@ with col3:
     )
 
 with col4:
-    total_districts = filtered_data['district'].nunique()
+    total_districts = int(kpis['Total_Districts'])
     st.metric(
         label = "Total Districts",
         value = f"{total_districts}",
@@ -188,7 +309,7 @@ with col4:
     )
 
 with col5:
-    total_records = len(filtered_data)
+    total_records = int(kpis['Total_Records'])
     st.metric(
         label = "Total Records",
         value = f"{total_records:,}",
@@ -208,99 +329,60 @@ tab1, tab2, tab3 = st.tabs(["Monthly Trends", "Quarterly Analysis", "Day of Week
 
 with tab1:
     st.subheader("Monthly Enrollment Trends")
+    monthly_section = st.empty()
 
-    # Group by month 
-    monthly_data = filtered_data.groupby('month')['total_enrollment'].agg(['sum', 'mean','count']).reset_index()
-    monthly_data.columns = ['Month', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
-
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs = [[{"secondary_y": True}]])
-
-    fig.add_trace(
-        go.Bar(x = monthly_data['Month'], y = monthly_data['Total_Enrollment'],
-               name = 'Total Enrollment', marker_color = 'steelblue'),
-               secondary_y = False,
-    )
-
-    fig.add_trace(
-        go.Scatter(x = monthly_data['Month'], y = monthly_data['Avg_Enrollment'],
-                   name = 'Average Enrollment', mode = 'lines+markers',
-                   marker = dict(size = 8, color = 'orange'), 
-                   line = dict(width = 3)),
-                   secondary_y = True,
-    )
+with tab2:
+    st.subheader("Quarterly Enrollment Distribution")
+    quarterly_section = st.empty()
 
+with tab3:
+    st.subheader("Day of Week Patterns")
+    dow_section = st.empty()
 
-    fig.update_layout(
-        title_text = "Monthly Enrollment Analysis",
-        hovermode = 'x unified',
-        autosize = True,
-        height = 500,
-        margin = dict(l = 80, r = 40, t = 80, b = 60)
-    )
 
-    fig.update_xaxes(title_text = "Month")
-    fig.update_yaxes(title_text = "Total Enrollment", secondary_y = False)
-    fig.update_yaxes(title_text = "Average Enrollment", secondary_y = True)
+def compute_monthly(filters):
+    # Group by month
+    monthly_data = monthly_summary(filters)
+    return monthly_data, figures.monthly_trend_figure(monthly_data)
 
+def render_monthly(result):
+    monthly_data, fig = result
     st.plotly_chart(fig, use_container_width = True)
+    rendering.dataframe(monthly_data, "Monthly Trends table", payload_report, use_container_width = True)
 
-    st.dataframe(monthly_data, use_container_width = True)
+defer(monthly_section, render_monthly, compute_monthly, filters)
 
 
-with tab2:
-    st.subheader("Quarterly Enrollment Distribution")
-    
-    quarterly_data = filtered_data.groupby('quarter')['total_enrollment'].agg(['sum', 'mean']).reset_index()
-    quarterly_data.columns = ['Quarter', 'Total_Enrollment', 'Avg_Enrollment']
-    
+def compute_quarterly(filters):
+    quarterly_data = quarterly_summary(filters)
+    return figures.quarterly_bar_figure(quarterly_data), figures.quarterly_pie_figure(quarterly_data)
+
+def render_quarterly(result):
+    bar_fig, pie_fig = result
     col1, col2 = st.columns(2)
     
     with col1:
         # Bar chart
-        fig = px.bar(quarterly_data, x='Quarter', y='Total_Enrollment',
-                     title='Total Enrollment by Quarter',
-                     color='Total_Enrollment',
-                     color_continuous_scale='Blues')
-        fig.update_layout(
-            autosize = True,
-            height=450,
-            margin = dict(l = 60, r = 40, t = 80, b = 60))
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(bar_fig, use_container_width=True, key="quarter_bar_chart",
+                        on_select=partial(on_chart_select, "quarter_bar_chart"), selection_mode="points")
     
     with col2:
         # Pie chart
-        fig = px.pie(quarterly_data, values='Total_Enrollment', names='Quarter',
-                     title='Enrollment Distribution by Quarter',
-                     hole=0.4)
-        fig.update_layout(
-            autosize=True,
-            margin=dict(l=60, r=40, t=80, b=60),
-            height=450)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(pie_fig, use_container_width=True, key="quarter_pie_chart",
+                        on_select=partial(on_chart_select, "quarter_pie_chart"), selection_mode="points")
 
-with tab3:
-    st.subheader("Day of Week Patterns")
-    
-    dow_data = filtered_data.groupby('day_of_week')['total_enrollment'].agg(['sum', 'mean']).reset_index()
-    dow_data.columns = ['Day_of_Week', 'Total_Enrollment', 'Avg_Enrollment']
-    dow_data['Day_Name'] = dow_data['Day_of_Week'].map({
-        0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
-        4: 'Friday', 5: 'Saturday', 6: 'Sunday'
-    })
-    
-    fig = px.bar(dow_data, x='Day_Name', y='Avg_Enrollment',
-                 title='Average Enrollment by Day of Week',
-                 color='Avg_Enrollment',
-                 color_continuous_scale='Viridis')
-    fig.update_layout(autosize=True,
-                      height=450,
-                      margin=dict(l=60, r=40, t=80, b=60))
-    st.plotly_chart(fig, use_container_width=True)
-    
+defer(quarterly_section, render_quarterly, compute_quarterly, quarter_source_filters)
+
+
+def compute_day_of_week(filters):
+    dow_data = day_of_week_summary(filters)
     # Weekend vs Weekday comparison
-    weekend_comparison = filtered_data.groupby('is_weekend')['total_enrollment'].agg(['sum', 'mean']).reset_index()
-    weekend_comparison['Type'] = weekend_comparison['is_weekend'].map({0: 'Weekday', 1: 'Weekend'})
+    weekend_comparison = weekend_summary(filters)
+    return figures.day_of_week_figure(dow_data), weekend_comparison
+
+def render_day_of_week(result):
+    fig, weekend_comparison = result
+    st.plotly_chart(fig, use_container_width=True)
     
     col1, col2 = st.columns(2)
     
@@ -308,27 +390,29 @@ with tab3:
     weekend_comparison['Type'] == 'Weekday'
 ]
 
-with col1:
-    if weekday_df.shape[0] > 0:
-        st.metric(
-            "Weekday Avg Enrollment",
-            f"{weekday_df['mean'].iloc[0]:,.0f}"
-        )
-    else:
-        st.metric("Weekday Avg Enrollment", "N/A")
+    with col1:
+        if weekday_df.shape[0] > 0:
+            st.metric(
+                "Weekday Avg Enrollment",
+                f"{weekday_df['mean'].iloc[0]:,.0f}"
+            )
+        else:
+            st.metric("Weekday Avg Enrollment", "N/A")
 
     weekend_df = weekend_comparison.loc[
     weekend_comparison['Type'] == 'Weekend'
 ]
 
-with col2:
-    if weekend_df.shape[0] > 0:
-        st.metric(
-            "Weekend Avg Enrollment",
-            f"{weekend_df['mean'].iloc[0]:,.0f}"
-        )
-    else:
-        st.metric("Weekend Avg Enrollment", "N/A")
+    with col2:
+        if weekend_df.shape[0] > 0:
+            st.metric(
+                "Weekend Avg Enrollment",
+                f"{weekend_df['mean'].iloc[0]:,.0f}"
+            )
+        else:
+            st.metric("Weekend Avg Enrollment", "N/A")
+
+defer(dow_section, render_day_of_week, compute_day_of_week, filters)
 
 st.markdown("---")
 
@@ -345,42 +429,40 @@ tab1, tab2, tab3 = st.tabs(["Interactive India Map", "State-wise Analysis", "Dis
 
 with tab1:
     st.subheader("📍 Interactive Map - State-wise Enrollment")
+    map_section = st.empty()
     
-    # Prepare data for map
-    state_map_data = filtered_data.groupby('state')['total_enrollment'].agg(['sum', 'mean', 'count']).reset_index()
-    state_map_data.columns = ['state', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
-    
-    # Create choropleth map
-    fig = px.choropleth(
-        state_map_data,
-        geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
-        featureidkey='properties.ST_NM',
-        locations='state',
-        color='Total_Enrollment',
-        color_continuous_scale='Viridis',
-        hover_name='state',
-        hover_data={
-            'state': False,
-            'Total_Enrollment': ':,',
-            'Avg_Enrollment': ':,.0f',
-            'Records': ':,'
-        },
-        title='Total Enrollment by State - Interactive Map',
-        labels={'Total_Enrollment': 'Total Enrollments'}
-    )
+    st.markdown("---")
     
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False
-    )
+    # State selection for detailed view
+    st.subheader("🔍 District-wise Map View")
     
-    fig.update_layout(
-        autosize=True,
-        height=600,
-        margin=dict(l=0, r=0, t=50, b=0)
+    reset_on_new_options("selected_map_state", available_states)
+    selected_map_state = st.selectbox(
+        "Select a state to view district-level enrollment",
+        options=available_states,
+        key="selected_map_state"
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    map_district_section = st.empty()
+
+with tab2:
+    st.subheader("State-wise Enrollment Statistics")
+    state_section = st.empty()
+
+with tab3:
+    st.subheader("District-wise Enrollment Analysis")
+    district_section = st.empty()
+
+
+def compute_map(filters):
+    # Prepare data for map
+    state_map_data = state_summary(filters).rename(columns={'State': 'state'})
+    return state_map_data, figures.state_map_figure(state_map_data)
+
+def render_map(result):
+    state_map_data, fig = result
+    st.plotly_chart(fig, use_container_width=True, key="map_chart",
+                    on_select=partial(on_chart_select, "map_chart"), selection_mode="points")
+    st.caption("💡 Click a state (or a bar in the Top 15 states / a quarter) to cross-filter the dashboard")
     
     # Map insights
     col1, col2, col3 = st.columns(3)
@@ -407,135 +489,79 @@ with tab1:
             "📊 Average per State",
             f"{avg_state_enrollment:,.0f}"
         )
+
+defer(map_section, render_map, compute_map, state_source_filters)
+
+
+def compute_map_districts(filters, state):
+    # Filter data for selected state
+    map_district_data = district_summary(filters, state)
+    return (
+        map_district_data,
+        figures.district_treemap_figure(map_district_data),
+        figures.district_sunburst_figure(map_district_data, state),
+        figures.state_top_districts_figure(map_district_data, state),
+    )
+
+def render_map_districts(result):
+    map_district_data, fig_tree, fig_sun, fig = result
+
+    # Create two columns for different visualizations
+    col_vis1, col_vis2 = st.columns(2)
     
-    st.markdown("---")
+    with col_vis1:
+        # Treemap visualization
+        st.markdown(f"#### 📦 Treemap - District Enrollment in {selected_map_state}")
+        st.plotly_chart(fig_tree, use_container_width=True)
     
-    # State selection for detailed view
-    st.subheader("🔍 District-wise Map View")
+    with col_vis2:
+        # Sunburst chart
+        st.markdown(f"#### ☀️ Sunburst - District Distribution")
+        st.plotly_chart(fig_sun, use_container_width=True)
     
-    selected_map_state = st.selectbox(
-        "Select a state to view district-level enrollment",
-        options=sorted(filtered_data['state'].unique())
-    )
+    st.info("💡 **Visualization Info**: Treemap and Sunburst sizes represent enrollment volume. Larger boxes/segments = higher enrollments.")
     
-    if selected_map_state:
-        # Filter data for selected state
-        state_district_data = filtered_data[filtered_data['state'] == selected_map_state]
-        district_summary = state_district_data.groupby('district')['total_enrollment'].agg(['sum', 'mean', 'count']).reset_index()
-        district_summary.columns = ['District', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
-        district_summary = district_summary.sort_values('Total_Enrollment', ascending=False)
+    st.markdown("---")
 
-        # Create two columns for different visualizations
-        col_vis1, col_vis2 = st.columns(2)
-        
-        with col_vis1:
-            # Treemap visualization
-            st.markdown(f"#### 📦 Treemap - District Enrollment in {selected_map_state}")
-            fig_tree = px.treemap(
-                district_summary.head(30),
-                path=['District'],
-                values='Total_Enrollment',
-                color='Total_Enrollment',
-                color_continuous_scale='Viridis',
-                hover_data={'Total_Enrollment': ':,', 'Avg_Enrollment': ':,.0f'},
-                title=f'Top 30 Districts Treemap'
-            )
-            fig_tree.update_layout(
-                height=500,
-                margin=dict(l=10, r=10, t=40, b=10)
-            )
-            fig_tree.update_traces(
-                textposition='middle center',
-                textfont_size=11
-            )
-            st.plotly_chart(fig_tree, use_container_width=True)
-        
-        with col_vis2:
-            # Sunburst chart
-            st.markdown(f"#### ☀️ Sunburst - District Distribution")
-            # Add state column for sunburst
-            district_sunburst = district_summary.head(20).copy()
-            district_sunburst['state'] = selected_map_state
-            
-            fig_sun = px.sunburst(
-                district_sunburst,
-                path=['state', 'District'],
-                values='Total_Enrollment',
-                color='Total_Enrollment',
-                color_continuous_scale='Plasma',
-                hover_data={'Total_Enrollment': ':,'},
-                title=f'Top 20 Districts Hierarchy'
-            )
-            fig_sun.update_layout(
-                height=500,
-                margin=dict(l=10, r=10, t=40, b=10)
-            )
-            st.plotly_chart(fig_sun, use_container_width=True)
-        
-        st.info("💡 **Visualization Info**: Treemap and Sunburst sizes represent enrollment volume. Larger boxes/segments = higher enrollments.")
+
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Horizontal bar chart for districts
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown(f"#### {selected_map_state} Summary")
+        st.metric("Total Districts", len(map_district_data))
+        st.metric("Total Enrollments", f"{map_district_data['Total_Enrollment'].sum():,}")
+        st.metric("Average per District", f"{map_district_data['Avg_Enrollment'].mean():,.0f}")
         
         st.markdown("---")
+        st.markdown("#### Top 5 Districts")
+        for idx, row in map_district_data.head(5).iterrows():
+            st.write(f"**{row['District']}**")
+            st.caption(f"{row['Total_Enrollment']:,} enrollments")
+    
+    # Detailed district table
+    st.markdown(f"#### All Districts in {selected_map_state}")
+    rendering.dataframe(map_district_data, "Districts of selected state table", payload_report, use_container_width=True)
 
+if selected_map_state:
+    defer(map_district_section, render_map_districts, compute_map_districts, filters, selected_map_state)
 
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            # Horizontal bar chart for districts
-            fig = px.bar(
-                district_summary.head(20),
-                x='Total_Enrollment',
-                y='District',
-                orientation='h',
-                title=f'Top 20 Districts in {selected_map_state}',
-                color='Total_Enrollment',
-                color_continuous_scale='Teal',
-                hover_data={'Total_Enrollment': ':,', 'Avg_Enrollment': ':,.0f'}
-            )
-            fig.update_layout(
-                autosize=True,
-                height=600,
-                margin=dict(l=150, r=40, t=80, b=60),
-                yaxis={'categoryorder': 'total ascending'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown(f"#### {selected_map_state} Summary")
-            st.metric("Total Districts", len(district_summary))
-            st.metric("Total Enrollments", f"{district_summary['Total_Enrollment'].sum():,}")
-            st.metric("Average per District", f"{district_summary['Avg_Enrollment'].mean():,.0f}")
-            
-            st.markdown("---")
-            st.markdown("#### Top 5 Districts")
-            for idx, row in district_summary.head(5).iterrows():
-                st.write(f"**{row['District']}**")
-                st.caption(f"{row['Total_Enrollment']:,} enrollments")
-        
-        # Detailed district table
-        st.markdown(f"#### All Districts in {selected_map_state}")
-        st.dataframe(district_summary, use_container_width=True)
 
-with tab2:
-    st.subheader("State-wise Enrollment Statistics")
-    
-    state_data = filtered_data.groupby('state')['total_enrollment'].agg(['sum', 'mean', 'count']).reset_index()
-    state_data.columns = ['State', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
-    state_data = state_data.sort_values('Total_Enrollment', ascending=False)
-    
+def compute_states(filters):
+    state_data = state_summary(filters).sort_values('Total_Enrollment', ascending=False)
+    return state_data, figures.top_states_figure(state_data)
+
+def render_states(result):
+    state_data, fig = result
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Top 15 states bar chart
-        top_states = state_data.head(15)
-        fig = px.bar(top_states,
-                     x='Total_Enrollment',
-                     y='State',
-                     title='Top 15 States by Total Enrollment',
-                     orientation='h',
-                     color='Total_Enrollment',
-                     color_continuous_scale='Blues')
-        fig.update_layout(autosize=True, height=550, margin=dict(l=180, r=40, t=80, b=60))
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="top_states_chart",
+                        on_select=partial(on_chart_select, "top_states_chart"), selection_mode="points")
     
     with col2:
         st.markdown("#### Summary Statistics")
@@ -549,27 +575,18 @@ with tab2:
             st.write(f"**{row['State']}**: {row['Total_Enrollment']:,}")
     
     st.markdown("#### Complete State-wise Data")
-    st.dataframe(state_data, use_container_width=True)
+    rendering.dataframe(state_data, "State-wise table", payload_report, use_container_width=True)
 
-with tab3:
-    st.subheader("District-wise Enrollment Analysis")
-    
-    district_data = filtered_data.groupby(['state', 'district'])['total_enrollment'].agg(['sum', 'mean', 'count']).reset_index()
-    district_data.columns = ['State', 'District', 'Total_Enrollment', 'Avg_Enrollment', 'Records']
-    district_data = district_data.sort_values('Total_Enrollment', ascending=False)
-    
+defer(state_section, render_states, compute_states, state_source_filters)
+
+
+def compute_districts(filters):
+    district_data = district_summary(filters)
     # Top 20 districts
-    top_districts = district_data.head(20)
-    top_districts['State_District'] = top_districts['State'].fillna('').astype(str) + ' - ' + top_districts['District'].fillna('').astype(str)
-    
-    fig = px.bar(top_districts,
-                 x='Total_Enrollment',
-                 y='State_District',
-                 title='Top 20 Districts by Total Enrollment',
-                 orientation='h',
-                 color='Total_Enrollment',
-                 color_continuous_scale='Greens')
-    fig.update_layout(autosize=True, height=700, margin=dict(l=250, r=40, t=90, b=60))
+    return district_data, figures.top_districts_figure(district_data)
+
+def render_districts(result):
+    district_data, fig = result
     st.plotly_chart(fig, use_container_width=True)
     
     # District statistics
@@ -586,7 +603,9 @@ with tab3:
     
     # Full district table
     st.markdown("#### Complete District-wise Data")
-    st.dataframe(district_data, use_container_width=True)
+    rendering.dataframe(district_data, "District-wise table", payload_report, use_container_width=True)
+
+defer(district_section, render_districts, compute_districts, filters)
 
 st.markdown("---")
 
@@ -595,43 +614,34 @@ st.markdown("---")
 
 #-------------- Demographic Analysis ------------
 st.header("👥 Demographic Analysis")
+demographic_section = st.empty()
+
 
-# Calculate age group totals
-if 'age_0_5' in filtered_data.columns:
-    age_0_5_total = filtered_data['age_0_5'].sum()
-    age_5_17_total = filtered_data['age_5_17'].sum()
-    age_18_total = filtered_data['age_18_greater'].sum()
+def compute_demographics(filters):
+    # Calculate age group totals
+    age_data = age_distribution(filters)
+    if age_data is None:
+        return None
+    return age_data, figures.age_pie_figure(age_data), figures.age_bar_figure(age_data)
 
-    age_distribution = pd.DataFrame({
-        'Age_Group': ['0-5 years', '5-17 years', '18+ years'],
-        'Count': [age_0_5_total, age_5_17_total, age_18_total]
-    })
+def render_demographics(result):
+    if result is None:
+        st.warning("⚠️ Age group data not available in filtered dataset")
+        return
+
+    age_data, pie_fig, bar_fig = result
+    age_0_5_total, age_5_17_total, age_18_total = age_data['Count'].tolist()
 
     col1, col2 = st.columns(2)
 
 
     with col1:
         # Pie chart 
-        fig = px.pie(age_distribution, values = 'Count', names = 'Age_Group', 
-                     title = 'Age Group Distribution',
-                     hole = 0.4,
-                     color_discrete_sequence = px.colors.sequential.RdBu)
-        fig.update_layout(autosize=True,
-                          height=450,
-                          margin=dict(l=60, r=40, t=80, b=60))
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(pie_fig, use_container_width=True)
 
     with col2:
         # Bar chart 
-        fig = px.bar(age_distribution, x = 'Age_Group', y = 'Count', 
-                     title = 'Enrollment Count by Age Group',
-                     color = 'Age_Group',
-                     color_discrete_sequence = ['#3498db', '#2ecc71', '#e74c3c'])
-        fig.update_layout(autosize=True,
-                          height=450,
-                          margin=dict(l=60, r=40, t=80, b=60),
-                          showlegend=True)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(bar_fig, use_container_width=True)
 
     col1, col2, col3 = st.columns(3)
 
@@ -647,11 +657,11 @@ if 'age_0_5' in filtered_data.columns:
 
     
     # Minor vs Adult analysis 
-    if 'minor_dount' in filtered_data.columns:
+    if 'minor_dount' in data.columns:
         st.markdown("---")
         st.subheader("Minor vs Adult Enrollment")
 
-        total_minors = filtered_data['minor_count'].sum()
+        total_minors = filter_data(filters)['minor_count'].sum()
         total_adults = age_18_total 
 
         minor_adult_data = pd.DataFrame({
@@ -677,8 +687,7 @@ if 'age_0_5' in filtered_data.columns:
             minor_percentage = (total_minors / (total_minors + total_adults)) * 100
             st.metric("Minor Percentage", f"{minor_percentage:.1f}%")
 
-else:
-    st.warning("⚠️ Age group data not available in filtered dataset")
+defer(demographic_section, render_demographics, compute_demographics, filters)
 
 st.markdown("---")
 
@@ -688,73 +697,123 @@ st.markdown("---")
 # ------------- Comparative Analysis ---------------
 st.header("📊 Comparative Analysis")
 
-tab1, tab2 = st.tabs(["State Comparison", "Year-over-Year"])
+tab1, tab2, tab3 = st.tabs(["State Comparison", "Year-over-Year", "Regional Growth"])
 
 
 with tab1:
     st.subheader("Compare Multiple States")
     
     # Select states to compare
+    reset_on_new_options("compare_states", available_states)
     compare_states = st.multiselect(
         "Select states to compare (max 5)",
-        options=sorted(filtered_data['state'].unique()),
-        default=sorted(filtered_data['state'].unique())[:3],
-        max_selections=5
+        options=available_states,
+        default=available_states[:3],
+        max_selections=5,
+        key="compare_states"
     )
-    
-    if len(compare_states) > 0:
-        compare_data = filtered_data[filtered_data['state'].isin(compare_states)]
-        
-        # Monthly comparison
-        monthly_compare = compare_data.groupby(['state', 'month'])['total_enrollment'].sum().reset_index()
-        
-        fig = px.line(monthly_compare, x='month', y='total_enrollment', color='state',
-                      title='Monthly Enrollment Comparison',
-                      markers=True,
-                      labels={'total_enrollment': 'Total Enrollment', 'month': 'Month'})
-        fig.update_layout(autosize=True, height=400)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # State statistics
-        state_stats = compare_data.groupby('state')['total_enrollment'].agg(['sum', 'mean', 'median', 'std']).reset_index()
-        state_stats.columns = ['State', 'Total', 'Mean', 'Median', 'Std Dev']
-        
-        st.dataframe(state_stats, use_container_width=True)
-
-
+    comparison_section = st.empty()
 
 with tab2:
     st.subheader("Year-over-Year Analysis")
+    yearly_section = st.empty()
+
+with tab3:
+    st.subheader("Regional Growth (MoM, QoQ, YoY)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        growth_level = st.radio("Region level", options=list(GROWTH_LEVELS), horizontal=True, key="growth_level")
+
+    with col2:
+        growth_granularity = st.radio("Growth period", options=list(GROWTH_PERIODS), horizontal=True, key="growth_granularity")
+
+    growth_section = st.empty()
+
+
+def compute_comparison(filters, states):
+    monthly_compare, state_stats = state_comparison(filters, states)
+    # Monthly comparison
+    return figures.state_comparison_figure(monthly_compare), state_stats
+
+def render_comparison(result):
+    fig, state_stats = result
+    st.plotly_chart(fig, use_container_width=True)
     
-    yearly_data = filtered_data.groupby('year')['total_enrollment'].agg(['sum', 'mean']).reset_index()
-    yearly_data.columns = ['Year', 'Total_Enrollment', 'Avg_Enrollment']
+    # State statistics
+    rendering.dataframe(state_stats, "State Comparison table", payload_report, use_container_width=True)
+
+if len(compare_states) > 0:
+    defer(comparison_section, render_comparison, compute_comparison, filters, tuple(compare_states))
+
+
+def compute_yearly(filters):
+    # Includes the YoY growth column when there are several years
+    yearly_data = yearly_summary(filters)
+    if len(yearly_data) <= 1:
+        return yearly_data, None, None
+    return yearly_data, figures.yearly_total_figure(yearly_data), figures.yearly_growth_figure(yearly_data)
+
+def render_yearly(result):
+    yearly_data, total_fig, growth_fig = result
     
     if len(yearly_data) > 1:
-        # Calculate YoY growth
-        yearly_data['Growth_%'] = yearly_data['Total_Enrollment'].pct_change() * 100
-        
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.bar(yearly_data, x='Year', y='Total_Enrollment',
-                         title='Total Enrollment by Year',
-                         color='Total_Enrollment',
-                         color_continuous_scale='Blues')
-            fig.update_layout(autosize=True, height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(total_fig, use_container_width=True)
         
         with col2:
-            fig = px.line(yearly_data, x='Year', y='Growth_%',
-                          title='Year-over-Year Growth Rate (%)',
-                          markers=True)
-            fig.add_hline(y=0, line_dash="dash", line_color="red")
-            fig.update_layout(autosize=True, height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(growth_fig, use_container_width=True)
         
-        st.dataframe(yearly_data, use_container_width=True)
+        rendering.dataframe(yearly_data, "Year-over-Year table", payload_report, use_container_width=True)
     else:
         st.info("ℹ️ Multiple years needed for year-over-year comparison")
 
+defer(yearly_section, render_yearly, compute_yearly, filters)
+
+
+def compute_growth(filters, level, granularity):
+    growth_ranks = growth_ranking(filters, level, granularity)
+    if len(growth_ranks) == 0:
+        return growth_ranks, []
+
+    # Small multiples of the period totals for the extremes of the ranking
+    growth_totals, _ = growth_matrices(filters, level, granularity)
+    ranked_regions = growth_ranks.dropna(subset=['Growth_%'])['Region']
+
+    # Split the ranking so a region never shows up in both panels
+    growers = min(8, (len(ranked_regions) + 1) // 2)
+    decliners = min(8, len(ranked_regions) - growers)
+
+    small_multiples = []
+    for title, regions in [
+        ('Fastest Growers', ranked_regions.head(growers)),
+        ('Fastest Decliners', ranked_regions.tail(decliners).iloc[::-1]),
+    ]:
+        if len(regions) > 0:
+            small_multiples.append(
+                figures.growth_small_multiples_figure(growth_totals, regions, f'{title} ({granularity})')
+            )
+    return growth_ranks, small_multiples
+
+def render_growth(result):
+    growth_ranks, small_multiples = result
+
+    if len(growth_ranks) > 0:
+        st.markdown(f"#### {growth_granularity} growth in {growth_ranks['Period'].iloc[0]} by {growth_level.lower()}")
+        st.caption("Ranked on the latest period the data covers in full that follows a period with data")
+        rendering.dataframe(growth_ranks, "Regional Growth table", payload_report, use_container_width=True, hide_index=True)
+
+        for col, fig in zip(st.columns(2), small_multiples):
+            with col:
+                st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("ℹ️ At least two consecutive complete periods with data are needed for growth comparison")
+
+defer(growth_section, render_growth, compute_growth, filters, growth_level, growth_granularity)
+
 st.markdown("---")
 
 
@@ -767,28 +826,48 @@ st.header("🔍 Data Explorer")
 
 st.subheader("Raw Data View")
 
-# show/hide columns selector
-all_columns = filtered_data.columns.tolist()
+# show/hide columns selector; columns outside the core set load on first use
+all_columns = dataset_schema().columns.tolist()
 selected_columns = st.multiselect(
     "Select columns to display",
     options=all_columns,
-    default=all_columns[:10]
+    default=all_columns[:10],
+    key="selected_columns"
 )
+explorer_section = st.empty()
 
-if len(selected_columns) > 0:
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def export_csv(filters, selected_columns):
+    """CSV of the filtered rows and selected columns"""
+    selected_columns = list(selected_columns)
+    return with_columns(filter_data(filters), selected_columns)[selected_columns].to_csv(index=False).encode('utf-8')
+
+def compute_explorer(filters, selected_columns):
+    selected_columns = list(selected_columns)
     # Display filtered data
-    display_df = filtered_data[selected_columns].head(100)
-    st.dataframe(display_df, use_container_width=True)
+    return with_columns(filter_data(filters).head(100), selected_columns)[selected_columns]
+
+def render_explorer(display_df):
+    rendering.dataframe(display_df, "Data Explorer table", payload_report, use_container_width=True)
     
-    # Download button
-    csv = filtered_data.to_csv(index=False).encode('utf-8')
+    # Download button. The CSV (selected columns) is only built when it is
+    # clicked, so it stays out of every rerun.
     st.download_button(
         label="📥 Download Filtered Data as CSV",
-        data=csv,
+        data=partial(export_csv, filters, tuple(selected_columns)),
         file_name='aadhaar_enrollment_filtered.csv',
         mime='text/csv',
+        key="download_export"
     )
 
+if len(selected_columns) > 0:
+    defer(explorer_section, render_explorer, compute_explorer, filters, tuple(selected_columns))
+
+with st.expander("💾 Memory Report"):
+    st.caption("Bytes per loaded column before and after categorical encoding and integer downcasting")
+    st.dataframe(memory_report(), use_container_width=True)
+
 st.markdown("---")
 
 
@@ -799,34 +878,55 @@ st.markdown("---")
 # -------------- Statistical Summary -----------
 st.header("📈 Statistical Summary")
 
-# Select numerical columns
-numerical_cols = filtered_data.select_dtypes(include=[np.number]).columns.tolist()
+# Select numerical columns. Core columns use their loaded dtypes, the rest
+# the sampled schema and are checked again once loaded. The dtypes are read
+# from an empty slice, since select_dtypes on the full frame copies it.
+loaded_numeric = data.head(0).select_dtypes(include=[np.number]).columns
+sampled_numeric = dataset_schema().select_dtypes(include=[np.number]).columns
+numerical_cols = [c for c in dataset_schema().columns
+                  if (c in loaded_numeric if c in data.columns else c in sampled_numeric)]
 
 if len(numerical_cols) > 0:
     selected_metric = st.selectbox(
         "Select metric for statistical analysis",
-        options=numerical_cols
+        options=numerical_cols,
+        key="selected_metric"
     )
-    
+    statistics_section = st.empty()
+
+
+def compute_statistics(filters, metric):
+    metric_values = with_columns(filter_data(filters), [metric])[[metric]]
+    if not pd.api.types.is_numeric_dtype(metric_values[metric]):
+        return None
+    statistics = {
+        "Mean": metric_values[metric].mean(),
+        "Median": metric_values[metric].median(),
+        "Std Dev": metric_values[metric].std(),
+        "Min": metric_values[metric].min(),
+        "Max": metric_values[metric].max(),
+    }
+    return figures.histogram_figure(metric_values, metric), statistics
+
+def render_statistics(result):
+    if result is None:
+        st.warning(f"{selected_metric} contains non-numeric values, so it has no statistical summary.")
+        return
+    fig, statistics = result
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Histogram
-        fig = px.histogram(filtered_data, x=selected_metric,
-                          title=f'Distribution of {selected_metric}',
-                          nbins=50,
-                          color_discrete_sequence=['steelblue'])
-        fig.update_layout(autosize=True, height=400)
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         # Statistics
         st.markdown("#### Statistics")
-        st.metric("Mean", f"{filtered_data[selected_metric].mean():,.2f}")
-        st.metric("Median", f"{filtered_data[selected_metric].median():,.2f}")
-        st.metric("Std Dev", f"{filtered_data[selected_metric].std():,.2f}")
-        st.metric("Min", f"{filtered_data[selected_metric].min():,.2f}")
-        st.metric("Max", f"{filtered_data[selected_metric].max():,.2f}")
+        for label, value in statistics.items():
+            st.metric(label, f"{value:,.2f}")
+
+if len(numerical_cols) > 0:
+    defer(statistics_section, render_statistics, compute_statistics, filters, selected_metric)
 
 st.markdown("---")
 
@@ -853,3 +953,26 @@ st.markdown(
 
 )
 
+
+
+# ------------- Fill in deferred sections ---------------
+# Sections render in the order their computations finish. If this rerun is
+# interrupted, the next one cancels whatever is still queued. A section that
+# fails shows its error in place; the other sections still render.
+st.session_state['pending_sections'] = list(deferred_sections)
+
+for future in as_completed(deferred_sections):
+    placeholder, render = deferred_sections[future]
+    with placeholder.container():
+        try:
+            render(future.result())
+        except Exception as exc:
+            st.exception(exc)
+
+st.session_state['pending_sections'] = []
+
+with st.sidebar.expander("📦 Payload Report"):
+    payload_data = payload_report.to_frame()
+    st.caption(f"Serialized size of each chart and table in this view "
+               f"(budget {payload_report.budget // 1024:,} KB, total {payload_data['Sent_KB'].sum():,.0f} KB sent)")
+    st.dataframe(payload_data, use_container_width=True, hide_index=True)
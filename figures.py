@@ -0,0 +1,290 @@
+"""Plotly figure builders for the dashboard sections.
+
+Each function takes an aggregation result from aggregations.py and returns a
+figure without calling Streamlit, so figures can be built in worker threads
+or outside the app (e.g. for static reports).
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+INDIA_STATES_GEOJSON = "https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson"
+
+
+
+# ------------- Temporal -------------
+def monthly_trend_figure(monthly_data):
+    """Dual-axis monthly total (bars) and average (line)"""
+    fig = make_subplots(specs = [[{"secondary_y": True}]])
+
+    fig.add_trace(
+        go.Bar(x = monthly_data['Month'], y = monthly_data['Total_Enrollment'],
+               name = 'Total Enrollment', marker_color = 'steelblue'),
+               secondary_y = False,
+    )
+
+    fig.add_trace(
+        go.Scatter(x = monthly_data['Month'], y = monthly_data['Avg_Enrollment'],
+                   name = 'Average Enrollment', mode = 'lines+markers',
+                   marker = dict(size = 8, color = 'orange'),
+                   line = dict(width = 3)),
+                   secondary_y = True,
+    )
+
+    fig.update_layout(
+        title_text = "Monthly Enrollment Analysis",
+        hovermode = 'x unified',
+        autosize = True,
+        height = 500,
+        margin = dict(l = 80, r = 40, t = 80, b = 60)
+    )
+
+    fig.update_xaxes(title_text = "Month")
+    fig.update_yaxes(title_text = "Total Enrollment", secondary_y = False)
+    fig.update_yaxes(title_text = "Average Enrollment", secondary_y = True)
+    return fig
+
+
+def quarterly_bar_figure(quarterly_data):
+    fig = px.bar(quarterly_data, x='Quarter', y='Total_Enrollment',
+                 title='Total Enrollment by Quarter',
+                 color='Total_Enrollment',
+                 color_continuous_scale='Blues')
+    fig.update_layout(
+        autosize = True,
+        height=450,
+        margin = dict(l = 60, r = 40, t = 80, b = 60))
+    return fig
+
+
+def quarterly_pie_figure(quarterly_data):
+    fig = px.pie(quarterly_data, values='Total_Enrollment', names='Quarter',
+                 title='Enrollment Distribution by Quarter',
+                 hole=0.4)
+    fig.update_layout(
+        autosize=True,
+        margin=dict(l=60, r=40, t=80, b=60),
+        height=450)
+    return fig
+
+
+def day_of_week_figure(dow_data):
+    fig = px.bar(dow_data, x='Day_Name', y='Avg_Enrollment',
+                 title='Average Enrollment by Day of Week',
+                 color='Avg_Enrollment',
+                 color_continuous_scale='Viridis')
+    fig.update_layout(autosize=True,
+                      height=450,
+                      margin=dict(l=60, r=40, t=80, b=60))
+    return fig
+
+
+
+# ------------- Geographic -------------
+def state_map_figure(state_map_data):
+    """Choropleth of total enrollment per state"""
+    fig = px.choropleth(
+        state_map_data,
+        geojson=INDIA_STATES_GEOJSON,
+        featureidkey='properties.ST_NM',
+        locations='state',
+        color='Total_Enrollment',
+        color_continuous_scale='Viridis',
+        hover_name='state',
+        hover_data={
+            'state': False,
+            'Total_Enrollment': ':,',
+            'Avg_Enrollment': ':,.0f',
+            'Records': ':,'
+        },
+        title='Total Enrollment by State - Interactive Map',
+        labels={'Total_Enrollment': 'Total Enrollments'}
+    )
+
+    fig.update_geos(
+        fitbounds="locations",
+        visible=False
+    )
+
+    fig.update_layout(
+        autosize=True,
+        height=600,
+        margin=dict(l=0, r=0, t=50, b=0)
+    )
+    return fig
+
+
+def district_treemap_figure(district_data):
+    """Treemap of the top 30 districts of one state"""
+    fig_tree = px.treemap(
+        district_data.head(30),
+        path=['District'],
+        values='Total_Enrollment',
+        color='Total_Enrollment',
+        color_continuous_scale='Viridis',
+        hover_data={'Total_Enrollment': ':,', 'Avg_Enrollment': ':,.0f'},
+        title=f'Top 30 Districts Treemap'
+    )
+    fig_tree.update_layout(
+        height=500,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    fig_tree.update_traces(
+        textposition='middle center',
+        textfont_size=11
+    )
+    return fig_tree
+
+
+def district_sunburst_figure(district_data, state):
+    """Sunburst of the top 20 districts of one state"""
+    # Add state column for sunburst
+    district_sunburst = district_data.head(20).copy()
+    district_sunburst['state'] = state
+
+    fig_sun = px.sunburst(
+        district_sunburst,
+        path=['state', 'District'],
+        values='Total_Enrollment',
+        color='Total_Enrollment',
+        color_continuous_scale='Plasma',
+        hover_data={'Total_Enrollment': ':,'},
+        title=f'Top 20 Districts Hierarchy'
+    )
+    fig_sun.update_layout(
+        height=500,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    return fig_sun
+
+
+def state_top_districts_figure(district_data, state):
+    """Horizontal bars of the top 20 districts of one state"""
+    fig = px.bar(
+        district_data.head(20),
+        x='Total_Enrollment',
+        y='District',
+        orientation='h',
+        title=f'Top 20 Districts in {state}',
+        color='Total_Enrollment',
+        color_continuous_scale='Teal',
+        hover_data={'Total_Enrollment': ':,', 'Avg_Enrollment': ':,.0f'}
+    )
+    fig.update_layout(
+        autosize=True,
+        height=600,
+        margin=dict(l=150, r=40, t=80, b=60),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig
+
+
+def top_states_figure(state_data):
+    """Horizontal bars of the top 15 states (state_data sorted largest first)"""
+    top_states = state_data.head(15)
+    fig = px.bar(top_states,
+                 x='Total_Enrollment',
+                 y='State',
+                 title='Top 15 States by Total Enrollment',
+                 orientation='h',
+                 color='Total_Enrollment',
+                 color_continuous_scale='Blues')
+    fig.update_layout(autosize=True, height=550, margin=dict(l=180, r=40, t=80, b=60))
+    return fig
+
+
+def top_districts_figure(district_data):
+    """Horizontal bars of the top 20 districts nationally"""
+    top_districts = district_data.head(20).copy()
+    top_districts['State_District'] = top_districts['State'].fillna('').astype(str) + ' - ' + top_districts['District'].fillna('').astype(str)
+
+    fig = px.bar(top_districts,
+                 x='Total_Enrollment',
+                 y='State_District',
+                 title='Top 20 Districts by Total Enrollment',
+                 orientation='h',
+                 color='Total_Enrollment',
+                 color_continuous_scale='Greens')
+    fig.update_layout(autosize=True, height=700, margin=dict(l=250, r=40, t=90, b=60))
+    return fig
+
+
+
+# ------------- Demographic -------------
+def age_pie_figure(age_data):
+    fig = px.pie(age_data, values = 'Count', names = 'Age_Group',
+                 title = 'Age Group Distribution',
+                 hole = 0.4,
+                 color_discrete_sequence = px.colors.sequential.RdBu)
+    fig.update_layout(autosize=True,
+                      height=450,
+                      margin=dict(l=60, r=40, t=80, b=60))
+    return fig
+
+
+def age_bar_figure(age_data):
+    fig = px.bar(age_data, x = 'Age_Group', y = 'Count',
+                 title = 'Enrollment Count by Age Group',
+                 color = 'Age_Group',
+                 color_discrete_sequence = ['#3498db', '#2ecc71', '#e74c3c'])
+    fig.update_layout(autosize=True,
+                      height=450,
+                      margin=dict(l=60, r=40, t=80, b=60),
+                      showlegend=True)
+    return fig
+
+
+
+# ------------- Comparative -------------
+def state_comparison_figure(monthly_compare):
+    fig = px.line(monthly_compare, x='month', y='total_enrollment', color='state',
+                  title='Monthly Enrollment Comparison',
+                  markers=True,
+                  labels={'total_enrollment': 'Total Enrollment', 'month': 'Month'})
+    fig.update_layout(autosize=True, height=400)
+    return fig
+
+
+def yearly_total_figure(yearly_data):
+    fig = px.bar(yearly_data, x='Year', y='Total_Enrollment',
+                 title='Total Enrollment by Year',
+                 color='Total_Enrollment',
+                 color_continuous_scale='Blues')
+    fig.update_layout(autosize=True, height=400)
+    return fig
+
+
+def yearly_growth_figure(yearly_data):
+    fig = px.line(yearly_data, x='Year', y='Growth_%',
+                  title='Year-over-Year Growth Rate (%)',
+                  markers=True)
+    fig.add_hline(y=0, line_dash="dash", line_color="red")
+    fig.update_layout(autosize=True, height=400)
+    return fig
+
+
+def growth_small_multiples_figure(growth_totals, regions, title):
+    """One small line chart of period totals per region"""
+    trend = growth_totals.loc[regions].reset_index().melt(
+        id_vars='Region', var_name='Period', value_name='Total_Enrollment'
+    )
+    fig = px.line(trend, x='Period', y='Total_Enrollment',
+                  facet_col='Region', facet_col_wrap=2,
+                  title=title,
+                  markers=True)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+    fig.update_yaxes(matches=None, title_text='')
+    fig.update_xaxes(title_text='')
+    fig.update_layout(autosize=True, height=700, showlegend=False)
+    return fig
+
+
+
+# ------------- Statistical -------------
+def histogram_figure(metric_data, metric):
+    fig = px.histogram(metric_data, x=metric,
+                      title=f'Distribution of {metric}',
+                      nbins=50,
+                      color_discrete_sequence=['steelblue'])
+    fig.update_layout(autosize=True, height=400)
+    return fig
@@ -0,0 +1,274 @@
+"""Headless load test for the dashboard.
+
+Drives app.py through Streamlit's AppTest with N simulated concurrent
+sessions (threads in one process, sharing st.cache_data like a real server
+pod) and reports rerun latency percentiles, the time to build the CSV
+export when a session clicks its download button, throughput and peak RSS
+for each concurrency level. Nothing is served over the network and no
+browser is started.
+
+    python load_test.py --concurrency 1 2 4 8 --iterations 3
+
+Run it from the folder that holds the dataset CSV, the same as the app.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+# Session-state key under which each session's export data is kept
+DOWNLOAD_KEY = "_load_test_download"
+
+# With callable data, st.download_button only registers the callable and the
+# server runs it when the button is clicked. Keep the data in the session
+# state so the export step can do the same.
+_download_button = st.download_button
+
+
+def _recording_download_button(label, data, *args, **kwargs):
+    st.session_state[DOWNLOAD_KEY] = data
+    return _download_button(label, data, *args, **kwargs)
+
+
+st.download_button = _recording_download_button
+
+
+
+#------------ Interaction steps -----------
+# Each step changes one or more widgets on a running AppTest. The harness
+# reruns the script afterwards and times that rerun.
+
+def _values(widget):
+    """Option values of a filter multiselect, without the 'All' entry"""
+    values = []
+    for option in widget.options:
+        if option == 'All':
+            continue
+        values.append(int(option) if option.lstrip('-').isdigit() else option)
+    return values
+
+
+def change_state_filter(at, rng):
+    """Pick a few states in the sidebar"""
+    widget = at.multiselect(key="selected_states")
+    options = _values(widget)
+    widget.set_value(rng.sample(options, k=min(len(options), rng.randint(1, 4))))
+
+
+def change_year_quarter_filter(at, rng):
+    """Narrow the sidebar years and quarters"""
+    for key in ("selected_years", "selected_quarters"):
+        widget = at.multiselect(key=key)
+        options = _values(widget)
+        widget.set_value(rng.sample(options, k=min(len(options), rng.randint(1, 2))))
+
+
+def change_day_type(at, rng):
+    """Toggle the weekday/weekend radio"""
+    at.radio(key="weekend_options").set_value(
+        rng.choice(['All', 'Weekday Only', 'Weekend Only'])
+    )
+
+
+def reset_filters(at, rng):
+    """Return the sidebar to its defaults"""
+    for key in ("selected_states", "selected_years", "selected_quarters"):
+        at.multiselect(key=key).set_value(['All'])
+    at.radio(key="weekend_options").set_value('All')
+
+
+def switch_map_state(at, rng):
+    """Drill down into another state on the district map view"""
+    widget = at.selectbox(key="selected_map_state")
+    if widget.options:
+        widget.set_value(rng.choice(widget.options))
+
+
+def edit_compare_states(at, rng):
+    """Change the states in the State Comparison tab"""
+    widget = at.multiselect(key="compare_states")
+    options = list(widget.options)
+    if options:
+        widget.set_value(rng.sample(options, k=min(len(options), rng.randint(1, 5))))
+
+
+def download_export(at, rng):
+    """Pick explorer columns; the session then clicks the download button"""
+    widget = at.multiselect(key="selected_columns")
+    options = list(widget.options)
+    if options:
+        widget.set_value(rng.sample(options, k=min(len(options), rng.randint(3, 10))))
+
+
+SCRIPTS = {
+    "analyst": [change_state_filter, switch_map_state, edit_compare_states, download_export],
+    "planner": [change_year_quarter_filter, change_day_type, switch_map_state, switch_map_state],
+    "browser": [switch_map_state, edit_compare_states, reset_filters, download_export],
+}
+
+
+
+#------------ Sessions -----------
+def run_session(session_id, script_name, iterations, timeout, seed):
+    """Run one simulated session and return a list of timed reruns"""
+    rng = random.Random(seed + session_id)
+    samples = []
+
+    def timed_run(step_name):
+        start = time.perf_counter()
+        at.run(timeout=timeout)
+        elapsed = time.perf_counter() - start
+        samples.append({
+            "session": session_id,
+            "script": script_name,
+            "step": step_name,
+            "latency_s": elapsed,
+            "error": len(at.exception) > 0,
+        })
+
+    def timed_download():
+        # What the server does when the download button is clicked
+        data = at.session_state[DOWNLOAD_KEY] if DOWNLOAD_KEY in at.session_state else None
+        start = time.perf_counter()
+        error = data is None
+        if not error:
+            del at.session_state[DOWNLOAD_KEY]
+            try:
+                data = data() if callable(data) else data
+            except Exception:
+                error = True
+        samples.append({
+            "session": session_id,
+            "script": script_name,
+            "step": "export_file",
+            "latency_s": time.perf_counter() - start,
+            "error": error,
+        })
+
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    timed_run("initial_load")
+
+    for _ in range(iterations):
+        for step in SCRIPTS[script_name]:
+            if len(at.exception) > 0:
+                return samples
+            step(at, rng)
+            timed_run(step.__name__)
+            if step is download_export and len(at.exception) == 0:
+                timed_download()
+
+    return samples
+
+
+def reset_peak_rss():
+    """Start a new peak-RSS window (Linux only; elsewhere the peak is the
+    lifetime one and carries over between levels)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, since reset_peak_rss()"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux
+    if sys.platform == "darwin":
+        return usage / (1024 * 1024)
+    return usage / 1024
+
+
+def run_level(concurrency, iterations, timeout, seed):
+    """Run `concurrency` sessions at once and summarise their reruns"""
+    script_names = list(SCRIPTS)
+    reset_peak_rss()
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="session") as pool:
+        futures = [
+            pool.submit(run_session, i, script_names[i % len(script_names)], iterations, timeout, seed)
+            for i in range(concurrency)
+        ]
+        samples = [sample for future in futures for sample in future.result()]
+
+    wall = time.perf_counter() - start
+    reruns = [s for s in samples if s["step"] != "export_file"]
+    exports = [s for s in samples if s["step"] == "export_file"]
+    latencies = np.array([s["latency_s"] for s in reruns if not s["error"]])
+    export_latencies = np.array([s["latency_s"] for s in exports if not s["error"]])
+
+    if len(latencies) == 0:
+        p50 = p95 = p99 = float("nan")
+    else:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+
+    return {
+        "Concurrency": concurrency,
+        "Reruns": len(reruns),
+        "Errors": sum(s["error"] for s in samples),
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+        "Export_p50_ms": np.median(export_latencies) * 1000 if len(export_latencies) else float("nan"),
+        "Throughput_rps": len(latencies) / wall if wall > 0 else float("nan"),
+        "Peak_RSS_MB": peak_rss_mb(),
+    }, samples
+
+
+
+#------------ Command line -----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless concurrent-session load test for app.py")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="Concurrent session counts to test, in order")
+    parser.add_argument("--iterations", type=int, default=3,
+                        help="How many times each session repeats its script")
+    parser.add_argument("--timeout", type=float, default=60,
+                        help="Seconds allowed for a single rerun")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--samples-csv", default=None,
+                        help="Optional path to write every timed rerun as CSV")
+    args = parser.parse_args(argv)
+
+    rows = []
+    all_samples = []
+    for concurrency in args.concurrency:
+        print(f"Running {concurrency} concurrent session(s)...", flush=True)
+        row, samples = run_level(concurrency, args.iterations, args.timeout, args.seed)
+        rows.append(row)
+        for sample in samples:
+            sample["concurrency"] = concurrency
+        all_samples.extend(samples)
+
+    report = pd.DataFrame(rows)
+    print()
+    print(report.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+
+    if args.samples_csv:
+        pd.DataFrame(all_samples).to_csv(args.samples_csv, index=False)
+        print(f"\nWrote {len(all_samples)} samples to {args.samples_csv}")
+
+    return 1 if report["Errors"].sum() > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""Payload-budgeted rendering of charts and tables.
+
+Every figure and table the dashboard sends to the browser is measured against
+a byte budget (AADHAAR_PAYLOAD_BUDGET_KB, default 512 KB). Over budget,
+figures fall back to WebGL traces, pre-binned histograms and decimated series,
+and tables are paged server-side. Sizes are collected in a PayloadReport so
+the dashboard can show them and regressions stay visible.
+"""
+import logging
+import math
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pyarrow as pa
+from plotly.io.json import to_json_plotly
+import streamlit as st
+
+PAYLOAD_BUDGET = int(os.environ.get("AADHAAR_PAYLOAD_BUDGET_KB", "512")) * 1024
+
+# Per-point trace attributes that must stay aligned when a series is decimated
+POINT_ATTRIBUTES = ['x', 'y', 'customdata', 'text', 'hovertext', 'ids']
+MARKER_ATTRIBUTES = ['color', 'size', 'symbol', 'opacity']
+
+# Series shorter than twice this are never decimated, longer ones keep at least this many points
+MIN_POINTS = 500
+
+# Scatter attributes that Scattergl rejects (px.line sets orientation on every trace)
+SCATTER_ONLY_ATTRIBUTES = [
+    'orientation', 'alignmentgroup', 'offsetgroup', 'cliponaxis', 'fillgradient',
+    'fillpattern', 'groupnorm', 'hoveron', 'stackgaps', 'stackgroup', 'zorder'
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+
+#------------ Measuring -----------
+def figure_payload(fig):
+    """Serialized size of a figure in bytes"""
+    return len(fig.to_json().encode('utf-8'))
+
+
+def table_payload(frame):
+    """Approximate Arrow size of a table in bytes, as st.dataframe sends it"""
+    try:
+        table = pa.Table.from_pandas(frame)
+    except (pa.ArrowException, ValueError, TypeError):
+        return int(frame.memory_usage(deep=True).sum())
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+class PayloadReport:
+    """Payload sizes recorded during one rerun (safe to fill from worker threads)"""
+
+    def __init__(self, budget=PAYLOAD_BUDGET):
+        self.budget = budget
+        self.entries = []
+
+    def record(self, element, kind, original, final, action):
+        self.entries.append({
+            'Element': element,
+            'Type': kind,
+            'Original_KB': original / 1024,
+            'Sent_KB': final / 1024,
+            'Action': action,
+            'Over_Budget': final > self.budget,
+        })
+        if final > self.budget:
+            _LOGGER.warning("%s '%s' is %.0f KB, over the %.0f KB payload budget",
+                            kind, element, final / 1024, self.budget / 1024)
+
+    def to_frame(self):
+        columns = ['Element', 'Type', 'Original_KB', 'Sent_KB', 'Action', 'Over_Budget']
+        frame = pd.DataFrame(self.entries, columns=columns)
+        return frame.sort_values('Sent_KB', ascending=False).reset_index(drop=True)
+
+
+
+#------------ Figure fallbacks -----------
+def _figure_name(fig):
+    return fig.layout.title.text or "Untitled chart"
+
+
+def _rebuild(fig, traces):
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+def _to_webgl(fig):
+    """Swap SVG scatter traces for their WebGL counterpart"""
+    traces, changed = [], False
+    for trace in fig.data:
+        if trace.type == 'scatter':
+            properties = {k: v for k, v in trace.to_plotly_json().items()
+                          if k != 'type' and k not in SCATTER_ONLY_ATTRIBUTES}
+            try:
+                trace = go.Scattergl(**properties)
+                changed = True
+            except ValueError:
+                pass
+        traces.append(trace)
+    return _rebuild(fig, traces) if changed else None
+
+
+def _prebin_histograms(fig):
+    """Replace raw-value histograms with bars of server-side bin counts"""
+    traces, changed = [], False
+    for trace in fig.data:
+        if trace.type == 'histogram' and trace.x is not None and trace.y is None:
+            values = pd.to_numeric(pd.Series(trace.x), errors='coerce').dropna().to_numpy()
+            if len(values) > 0:
+                counts, edges = np.histogram(values, bins=trace.nbinsx or 50)
+                trace = go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                    name=trace.name, marker=trace.marker.to_plotly_json(), showlegend=trace.showlegend,
+                    xaxis=trace.xaxis, yaxis=trace.yaxis,
+                )
+                changed = True
+        traces.append(trace)
+    if not changed:
+        return None
+    fig = _rebuild(fig, traces)
+    fig.update_layout(bargap=0)
+    return fig
+
+
+def _series_length(trace):
+    """Number of points of a scatter series that could be decimated, else 0"""
+    if trace.type in ('scatter', 'scattergl') and trace.x is not None and len(trace.x) >= 2 * MIN_POINTS:
+        return len(trace.x)
+    return 0
+
+
+def _point_arrays(properties, n):
+    """(container, name) of every per-point array in a trace's properties"""
+    marker = properties.get('marker') or {}
+    for name in POINT_ATTRIBUTES:
+        value = properties.get(name)
+        if value is not None and not isinstance(value, str) and len(value) == n:
+            yield properties, name
+    for name in MARKER_ATTRIBUTES:
+        value = marker.get(name)
+        if value is not None and not isinstance(value, str) and np.ndim(value) == 1 and len(value) == n:
+            yield marker, name
+
+
+def _point_bytes(fig):
+    """Serialized size of the per-point arrays of every decimatable series"""
+    arrays = []
+    for trace in fig.data:
+        n = _series_length(trace)
+        if n:
+            arrays.extend(container[name] for container, name in _point_arrays(trace.to_plotly_json(), n))
+    return len(to_json_plotly(arrays).encode('utf-8'))
+
+
+def _decimate(fig, stride):
+    """Keep every `stride`-th point (plus the last) of long series, but never
+    fewer than MIN_POINTS of a series"""
+    traces, changed = [], False
+    for trace in fig.data:
+        n = _series_length(trace)
+        trace_stride = min(stride, n // MIN_POINTS)
+        if trace_stride >= 2:
+            keep = np.unique(np.r_[np.arange(0, n, trace_stride), n - 1])
+            properties = trace.to_plotly_json()
+            for container, name in list(_point_arrays(properties, n)):
+                container[name] = np.asarray(container[name])[keep]
+            trace = type(trace)(**{k: v for k, v in properties.items() if k != 'type'})
+            changed = True
+        traces.append(trace)
+    return _rebuild(fig, traces) if changed else None
+
+
+def fit_figure(fig, report, budget=None):
+    """Return `fig`, or a lighter equivalent if it is over the payload budget"""
+    budget = budget or report.budget
+    original = size = figure_payload(fig)
+    actions = []
+
+    for action, fallback in [('WebGL', _to_webgl), ('pre-binned', _prebin_histograms)]:
+        if size <= budget:
+            break
+        lighter = fallback(fig)
+        if lighter is not None:
+            fig, size = lighter, figure_payload(lighter)
+            actions.append(action)
+
+    max_stride = max((_series_length(trace) // MIN_POINTS for trace in fig.data), default=0)
+    if size > budget and max_stride >= 2:
+        # Only the per-point arrays shrink; layout and template stay as they are
+        points = _point_bytes(fig)
+        stride = max(2, math.ceil(points / max(budget - (size - points), 1)))
+        while True:
+            stride = min(stride, max_stride)
+            decimated = _decimate(fig, stride)
+            decimated_size = figure_payload(decimated)
+            if decimated_size <= budget or stride == max_stride:
+                break
+            stride += max(1, stride // 4)
+        fig, size = decimated, decimated_size
+        actions.append(f"decimated 1/{stride}")
+
+    report.record(_figure_name(fig), 'chart', original, size, ', '.join(actions) or '—')
+    return fig
+
+
+def fit_figures(result, report):
+    """fit_figure() every figure inside a (nested) tuple/list result"""
+    if isinstance(result, go.Figure):
+        return fit_figure(result, report)
+    if isinstance(result, tuple):
+        return tuple(fit_figures(item, report) for item in result)
+    if isinstance(result, list):
+        return [fit_figures(item, report) for item in result]
+    return result
+
+
+
+#------------ Tables -----------
+def dataframe(frame, name, report, budget=None, **kwargs):
+    """st.dataframe that pages large tables server-side to stay within budget"""
+    budget = budget or report.budget
+    size = table_payload(frame)
+
+    if size <= budget:
+        report.record(name, 'table', size, size, '—')
+        st.dataframe(frame, **kwargs)
+        return
+
+    rows_per_page = max(10, int(len(frame) * budget / size))
+    pages = math.ceil(len(frame) / rows_per_page)
+    key = "page_" + re.sub(r'\W+', '_', name.lower())
+    page = st.number_input(f"Page (1-{pages})", min_value=1, max_value=pages, value=1, step=1, key=key)
+
+    start = (int(page) - 1) * rows_per_page
+    shown = frame.iloc[start:start + rows_per_page]
+    st.dataframe(shown, **kwargs)
+    st.caption(f"Rows {start + 1:,}-{start + len(shown):,} of {len(frame):,} "
+               f"(paged to stay within the {budget // 1024:,} KB payload budget)")
+
+    report.record(name, 'table', size, table_payload(shown), f"paged, {rows_per_page:,} rows/page")
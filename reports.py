@@ -0,0 +1,271 @@
+"""Static per-state report bundles.
+
+Renders one self-contained HTML report per state / union territory plus a
+national one, using the same aggregations and figures as the dashboard.
+States are spread over a process pool that shares one loaded dataset, and
+states whose rows have not changed since the last run are skipped.
+
+    python reports.py --out reports --workers 4
+    python reports.py --out reports --states Kerala Goa --force
+"""
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+import aggregations
+import figures
+from aggregations import (
+    Filters, load_data, filter_data, kpi_summary, monthly_summary,
+    quarterly_summary, day_of_week_summary, state_summary, district_summary,
+    age_distribution, yearly_summary
+)
+
+# Bump when the report layout changes so every report is regenerated
+REPORT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+NATIONAL = "India"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+    body {{ font-family: sans-serif; background-color: #f5f7fa; margin: 0 auto; max-width: 1200px; padding: 2rem; }}
+    h1 {{ color: #1f77b4; font-weight: 700; }}
+    h2 {{ color: #2c3e50; font-weight: 600; border-bottom: 1px solid #ddd; padding-bottom: 0.3rem; }}
+    .kpis {{ display: flex; gap: 15px; flex-wrap: wrap; }}
+    .kpi {{ background-color: #ffffff; padding: 15px; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+    .kpi span {{ display: block; color: #555555; font-size: 13px; }}
+    .kpi strong {{ font-size: 22px; }}
+    table {{ border-collapse: collapse; background-color: #ffffff; font-size: 13px; margin: 1rem 0; }}
+    th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: right; }}
+    th {{ background-color: #eef2f7; }}
+    footer {{ color: #666666; font-size: 12px; text-align: center; margin-top: 2rem; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Generated {generated}</p>
+{body}
+<footer>Aadhaar Enrollment Analytics</footer>
+</body>
+</html>
+"""
+
+
+
+#------------ Report content -----------
+def slugify(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _table(frame):
+    return frame.to_html(index=False, border=0, float_format=lambda v: f"{v:,.2f}")
+
+
+def report_sections(state):
+    """(heading, figures, tables) for one state, or the national report"""
+    filters = Filters() if state == NATIONAL else Filters(states=(state,))
+
+    monthly_data = monthly_summary(filters)
+    quarterly_data = quarterly_summary(filters)
+    dow_data = day_of_week_summary(filters)
+    sections = [
+        ("📅 Temporal Analysis",
+         [figures.monthly_trend_figure(monthly_data),
+          figures.quarterly_bar_figure(quarterly_data),
+          figures.day_of_week_figure(dow_data)],
+         [monthly_data]),
+    ]
+
+    if state == NATIONAL:
+        state_data = state_summary(filters).sort_values('Total_Enrollment', ascending=False)
+        district_data = district_summary(filters)
+        sections.append(
+            ("🌎 States and Districts",
+             [figures.top_states_figure(state_data), figures.top_districts_figure(district_data)],
+             [state_data])
+        )
+    else:
+        district_data = district_summary(filters, state)
+        sections.append(
+            ("🌎 Districts",
+             [figures.district_treemap_figure(district_data),
+              figures.district_sunburst_figure(district_data, state),
+              figures.state_top_districts_figure(district_data, state)],
+             [district_data])
+        )
+
+    age_data = age_distribution(filters)
+    if age_data is not None:
+        sections.append(
+            ("👥 Demographic Analysis",
+             [figures.age_pie_figure(age_data), figures.age_bar_figure(age_data)],
+             [age_data])
+        )
+
+    yearly_data = yearly_summary(filters)
+    if len(yearly_data) > 1:
+        sections.append(
+            ("📊 Year-over-Year",
+             [figures.yearly_total_figure(yearly_data), figures.yearly_growth_figure(yearly_data)],
+             [yearly_data])
+        )
+
+    return filters, sections
+
+
+def render_report(state, out_dir):
+    """Write the HTML report for one state and return its path"""
+    filters, sections = report_sections(state)
+    kpis = kpi_summary(filters).iloc[0]
+
+    parts = ['<div class="kpis">']
+    for label, value in [
+        ("Total Enrollments", f"{int(kpis['Total_Enrollment']):,}"),
+        ("Average Enrollment", f"{kpis['Avg_Enrollment']:,.0f}"),
+        ("Total States", f"{int(kpis['Total_States'])}"),
+        ("Total Districts", f"{int(kpis['Total_Districts'])}"),
+        ("Total Records", f"{int(kpis['Total_Records']):,}"),
+    ]:
+        parts.append(f'<div class="kpi"><span>{label}</span><strong>{value}</strong></div>')
+    parts.append('</div>')
+
+    # plotly.js is inlined once, in the first figure, so the file works offline
+    include_plotlyjs = True
+    for heading, section_figures, tables in sections:
+        parts.append(f"<h2>{html.escape(heading)}</h2>")
+        for fig in section_figures:
+            parts.append(fig.to_html(full_html=False, include_plotlyjs=include_plotlyjs))
+            include_plotlyjs = False
+        for table in tables:
+            parts.append(_table(table))
+
+    title = f"Aadhaar Enrollment Report - {state}"
+    page = PAGE_TEMPLATE.format(
+        title=html.escape(title),
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        body="\n".join(parts),
+    )
+
+    path = os.path.join(out_dir, f"{slugify(state)}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return path
+
+
+
+#------------ Change detection -----------
+def fingerprint(state):
+    """Hash of the rows that feed a state's report"""
+    filters = Filters() if state == NATIONAL else Filters(states=(state,))
+    rows = filter_data(filters)
+    digest = int(pd.util.hash_pandas_object(rows, index=False).sum())
+    return f"{REPORT_VERSION}-{len(rows)}-{digest:016x}"
+
+
+def read_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_manifest(out_dir, manifest):
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+
+#------------ Process pool -----------
+def _init_worker(data_file):
+    """Point a worker at the dataset; a no-op load when the pool was forked"""
+    aggregations.DATA_FILE = data_file
+    load_data()
+
+
+def _pool_context():
+    # Forked workers inherit the dataset already loaded in the parent
+    # (copy-on-write) instead of each reading the CSV again
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render static per-state report bundles")
+    parser.add_argument("--out", default="reports", help="Output folder for the HTML files")
+    parser.add_argument("--data", default=aggregations.DATA_FILE, help="Feature-engineered CSV")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--states", nargs="+", default=None,
+                        help="Only these states (default: every state plus the national report)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the data is unchanged")
+    args = parser.parse_args(argv)
+
+    aggregations.DATA_FILE = args.data
+    try:
+        data = load_data()
+    except FileNotFoundError:
+        print(f"Data file not found: {args.data}", file=sys.stderr)
+        return 1
+
+    known = [NATIONAL] + sorted(data['state'].unique().tolist())
+    unknown = [state for state in args.states or [] if state not in known]
+    if unknown:
+        print(f"Unknown state(s): {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+
+    states = args.states or known
+    manifest = read_manifest(args.out)
+
+    todo = {}
+    for state in states:
+        current = fingerprint(state)
+        path = os.path.join(args.out, f"{slugify(state)}.html")
+        if not args.force and manifest.get(state) == current and os.path.exists(path):
+            continue
+        todo[state] = current
+
+    print(f"{len(states) - len(todo)} report(s) unchanged, rendering {len(todo)}...", flush=True)
+    start = time.perf_counter()
+    failures = 0
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(todo))),
+                                 mp_context=_pool_context(),
+                                 initializer=_init_worker, initargs=(args.data,)) as pool:
+            futures = {pool.submit(render_report, state, args.out): state for state in todo}
+            for future in as_completed(futures):
+                state = futures[future]
+                try:
+                    path = future.result()
+                except Exception as exc:
+                    failures += 1
+                    print(f"  ✗ {state}: {exc}", file=sys.stderr)
+                    continue
+                manifest[state] = todo[state]
+                print(f"  ✓ {state} -> {path}", flush=True)
+
+        write_manifest(args.out, manifest)
+
+    print(f"Done in {time.perf_counter() - start:,.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Tests for the payload-budget fallbacks in rendering.py (run with pytest)."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+import figures
+import rendering
+
+
+def _long_line(points):
+    frame = pd.DataFrame({'x': np.arange(points), 'y': np.random.default_rng(0).random(points)})
+    return px.line(frame, x='x', y='y', title='Long series')
+
+
+def test_px_line_switches_to_webgl():
+    monthly_compare = pd.DataFrame({
+        'state': ['Goa'] * 3 + ['Kerala'] * 3,
+        'month': [1, 2, 3] * 2,
+        'total_enrollment': [10, 20, 30, 15, 25, 35],
+    })
+    fig = rendering._to_webgl(figures.state_comparison_figure(monthly_compare))
+
+    assert fig is not None
+    assert [trace.type for trace in fig.data] == ['scattergl', 'scattergl']
+
+
+def test_short_series_are_never_decimated():
+    fig = _long_line(12)
+    report = rendering.PayloadReport(budget=1)
+
+    fitted = rendering.fit_figure(fig, report)
+
+    assert len(fitted.data[0].x) == 12
+    assert 'decimated' not in report.entries[0]['Action']
+
+
+def test_long_series_are_decimated_to_fit():
+    fig = _long_line(50_000)
+    budget = rendering.figure_payload(fig) // 4
+    report = rendering.PayloadReport(budget=budget)
+
+    fitted = rendering.fit_figure(fig, report)
+
+    assert rendering.figure_payload(fitted) <= budget
+    assert len(fitted.data[0].x) >= rendering.MIN_POINTS
+    # Sized from the point arrays, not the whole figure: no more cut than needed
+    assert len(fitted.data[0].x) > 50_000 / 8
+
+
+def test_decimation_keeps_minimum_points():
+    fig = _long_line(5_000)
+    report = rendering.PayloadReport(budget=1)
+
+    fitted = rendering.fit_figure(fig, report)
+
+    assert len(fitted.data[0].x) >= rendering.MIN_POINTS
+    assert fitted.data[0].x[-1] == 4_999